@@ -0,0 +1,105 @@
+"""
+Benchmark compressed vs. uncompressed overview transfers against a local stub
+with a throttled link
+
+    python benchmarks/bench_compression.py --bandwidth 1 10 100 --requests 20
+"""
+import argparse
+import gzip
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+from openclimate.ActorOverview import ActorOverview
+from openclimate.Transfer import transfer_stats
+
+CHUNK = 16 * 1024
+
+
+def synthetic_overview(n_datasets: int = 20, n_years: int = 270) -> bytes:
+    """country overview with many emissions datasets"""
+    emissions = {
+        f"DATASET:{i}:v1": {
+            "datasource_id": f"DATASET:{i}:v1",
+            "name": f"Emissions dataset {i}",
+            "publisher": "Publisher",
+            "published": "2022-11-01T00:00:00.000Z",
+            "URL": f"https://example.org/datasets/{i}",
+            "data": [
+                {
+                    "emissions_id": f"DATASET:{i}:v1:XX:{year}",
+                    "total_emissions": 1_000_000 + 17 * year + i,
+                    "year": year,
+                    "tags": [],
+                }
+                for year in range(1750, 1750 + n_years)
+            ],
+        }
+        for i in range(n_datasets)
+    }
+    return json.dumps({"data": {"actor_id": "XX", "name": "Stub", "emissions": emissions}}).encode()
+
+
+def serve(body: bytes, bandwidth: float) -> ThreadingHTTPServer:
+    """stub API sending at most `bandwidth` Mbit/s per response"""
+    compressed = gzip.compress(body)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            content = body
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                content = compressed
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            for start in range(0, len(content), CHUNK):
+                chunk = content[start:start + CHUNK]
+                self.wfile.write(chunk)
+                time.sleep(len(chunk) * 8 / (bandwidth * 1e6))
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+def run(server: str, n_requests: int, compression: bool) -> float:
+    """seconds to fetch `n_requests` overviews one after the other"""
+    start = time.perf_counter()
+    ActorOverview(server=server, compression=compression).overview(actor_id=["XX"] * n_requests, concurrency=1)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bandwidth", type=float, nargs="+", default=[1, 10, 100], help="link speeds in Mbit/s")
+    parser.add_argument("--requests", type=int, default=10)
+    args = parser.parse_args()
+
+    body = synthetic_overview()
+    print(f"overview: {len(body) / 1e6:.2f} MB, gzip: {len(gzip.compress(body)) / 1e6:.2f} MB")
+    print(f"{'Mbit/s':>8} {'identity s':>11} {'gzip s':>8} {'speedup':>8} {'wire MB':>8} {'decoded MB':>11}")
+    for bandwidth in args.bandwidth:
+        httpd = serve(body, bandwidth)
+        server = f"http://127.0.0.1:{httpd.server_address[1]}/api/v1"
+        identity = run(server, args.requests, compression=False)
+        transfer_stats.reset()
+        compressed = run(server, args.requests, compression=True)
+        stats = transfer_stats.to_frame().loc["/actor/{actor_id}"]
+        httpd.shutdown()
+        httpd.server_close()
+        print(
+            f"{bandwidth:>8g} {identity:>11.2f} {compressed:>8.2f} {identity / compressed:>7.1f}x"
+            f" {stats['wire_bytes'] / 1e6:>8.2f} {stats['decoded_bytes'] / 1e6:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
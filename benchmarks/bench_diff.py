@@ -0,0 +1,74 @@
+"""
+Benchmark the hashed revision diff
+
+    python benchmarks/bench_diff.py --rows 10000000
+    python benchmarks/bench_diff.py --rows 1000000 --snapshot csv
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from openclimate.Diff import Diff
+
+
+def synthetic(n_rows: int, revised: float = 0.01, n_years: int = 30, seed: int = 0):
+    """build two pulls of emissions where a fraction of the values was revised
+
+    Args:
+        n_rows (int): number of rows
+        revised (float): fraction of rows changed, added and removed
+        n_years (int): years per actor and datasource
+        seed (int): random seed
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: old and new pull
+    """
+    rng = np.random.default_rng(seed)
+    n_series = max(n_rows // n_years, 1)
+    actors = np.array([f"A{i:08d}" for i in range(n_series // 2 + 1)], dtype=object)
+    series = np.arange(n_series)
+    old = pd.DataFrame(
+        {
+            "actor_id": np.repeat(actors[series // 2], n_years),
+            "year": np.tile(np.arange(1990, 1990 + n_years), n_series),
+            "total_emissions": rng.uniform(1e3, 1e8, n_series * n_years),
+            "datasource_id": np.repeat(np.where(series % 2 == 0, "DS:a", "DS:b").astype(object), n_years),
+        }
+    )
+    n_revised = int(len(old) * revised)
+    new = old.copy()
+    new.loc[rng.choice(len(new), n_revised, replace=False), "total_emissions"] *= 1.01
+    new = new.drop(index=rng.choice(len(new), n_revised, replace=False))
+    added = old.sample(n_revised, random_state=seed)
+    added["actor_id"] = "N" + added["actor_id"]
+    return old, pd.concat([new, added], ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--snapshot", choices=["csv", "parquet"], help="diff saved snapshots instead of dataframes")
+    parser.add_argument("--chunk-size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    old, new = synthetic(args.rows)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if args.snapshot:
+            paths = [os.path.join(tmp_dir, f"{name}.{args.snapshot}") for name in ["old", "new"]]
+            for df, path in zip([old, new], paths):
+                getattr(df, f"to_{args.snapshot}")(path, index=False)
+            old, new = paths
+
+        start = time.perf_counter()
+        result = Diff(chunk_size=args.chunk_size).diff(old, new, metric="emissions")
+        elapsed = time.perf_counter() - start
+
+    print(f"{args.rows} rows{' from ' + args.snapshot if args.snapshot else ''}: {elapsed:.2f}s  {result.summary}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark the vectorized target-progress evaluation
+
+    python benchmarks/bench_progress.py --targets 10000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from openclimate.Progress import Progress
+
+
+def synthetic(n_targets: int, targets_per_actor: int = 2, n_years: int = 30, seed: int = 0):
+    """build synthetic targets and emissions
+
+    Args:
+        n_targets (int): number of targets
+        targets_per_actor (int): targets per actor
+        n_years (int): years of emissions per actor
+        seed (int): random seed
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: targets and emissions
+    """
+    rng = np.random.default_rng(seed)
+    n_actors = max(n_targets // targets_per_actor, 1)
+    actors = np.array([f"A{i:06d}" for i in range(n_actors)])
+    years = np.arange(1990, 1990 + n_years)
+
+    emissions = pd.DataFrame(
+        {
+            "actor_id": np.repeat(actors, n_years),
+            "year": np.tile(years, n_actors),
+            "total_emissions": rng.uniform(1e5, 1e8, n_actors * n_years),
+        }
+    )
+    targets = pd.DataFrame(
+        {
+            "actor_id": rng.choice(actors, n_targets),
+            "target_type": "Absolute emission reduction",
+            "baseline_year": rng.choice(years[:15], n_targets),
+            "target_year": rng.choice([2030, 2040, 2050], n_targets),
+            "target_value": rng.integers(10, 100, n_targets),
+            "target_unit": "percent",
+        }
+    )
+    return targets, emissions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--targets", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    targets, emissions = synthetic(args.targets)
+    progress = Progress()
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        df = progress._evaluate(targets, emissions)
+        timings.append(time.perf_counter() - start)
+
+    print(f"targets: {len(targets):,}  emissions rows: {len(emissions):,}")
+    print(f"best: {min(timings) * 1000:.1f} ms  mean: {np.mean(timings) * 1000:.1f} ms")
+    print(f"on track: {int(df['on_track'].sum()):,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,13 @@
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import pandas as pd
-import requests
-from typing import List, Union, Tuple, Optional
+from typing import List, Dict, Union, Tuple, Any, Iterator, Optional
 import warnings
 
-from .utils import async_func
+from .utils import async_func, check_backend, iter_json_array, iter_pages, records_to_frame
 from .Base import Base
+from .Transfer import get_json, iter_content
 
 
 @dataclass
@@ -14,9 +15,15 @@ class ActorOverview(Base):
     """ActorOveriew API class
     get overview information of an actor
 
+    Args:
+        compression (bool): request compressed responses. Defaults to True.
+
     Returns:
         object
     """
+
+    compression: bool = True
+
     @async_func
     def _overview_single_actor(self, actor_id: str, ignore_warnings: bool = False, *args, **kwargs):
         """retreive actor emissions
@@ -31,8 +38,7 @@ class ActorOverview(Base):
         warnings.simplefilter('ignore') if ignore_warnings else warnings.simplefilter('default')
         endpoint = f"/actor/{actor_id}"
         url = f"{self.server}{endpoint}"
-        headers = {"Accept": "application/json"}
-        response = requests.get(url, headers=headers).json()
+        response = get_json(url, endpoint="/actor/{actor_id}", compression=self.compression)
         data_list = response.get("data", None)
         if data_list is None:
             warnings.warn(
@@ -41,49 +47,72 @@ class ActorOverview(Base):
             return None
         return data_list
 
-    async def _overview_coros(self, actor_id: Union[str, List[str], Tuple[str]], ignore_warnings: bool = False, *args, **kwargs):
+    async def _overview_coros(
+        self,
+        actor_id: Union[str, List[str], Tuple[str]],
+        ignore_warnings: bool = False,
+        concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+        *args,
+        **kwargs,
+    ):
         """overview coroutines
 
         Args:
             actor_id (str): actor identifier. Defaults to None.
             ignore_warnings (bool): ignore warning messages
+            concurrency (int, optional): maximum number of simultaneous requests
+            return_exceptions (bool): return exceptions in place of failed overviews
 
         Returns:
             Dict: dictionary with actor overview
         """
+        if concurrency:
+            asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=concurrency))
         actor_list = [actor_id] if isinstance(actor_id, str) else actor_id
         tasks = [
             asyncio.create_task(self._overview_single_actor(actor_id=actor, ignore_warnings=ignore_warnings))
             for actor in actor_list
         ]
-        results = await asyncio.gather(*tasks)
+        results = await asyncio.gather(*tasks, return_exceptions=return_exceptions)
         return results
 
     def overview(
-        self, actor_id: Union[str, List[str], Tuple[str]], ignore_warnings: bool = False
+        self,
+        actor_id: Union[str, List[str], Tuple[str]],
+        ignore_warnings: bool = False,
+        concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
     ):
         """Retretive actor overview
 
         Args:
             actor_id (Union[str, List[str], Tuple[str]]): actor identifier. Defaults to None.
             ignore_warnings (bool): ignore warning messages
+            concurrency (int, optional): maximum number of simultaneous requests. Defaults to the event loop executor size.
+            return_exceptions (bool): return exceptions in place of failed overviews instead of raising. Defaults to False.
 
         Returns:
             List[Dict]: dictionary with actor overview
         """
-        return asyncio.run(self._overview_coros(actor_id=actor_id, ignore_warnings=ignore_warnings))
+        return asyncio.run(
+            self._overview_coros(
+                actor_id=actor_id,
+                ignore_warnings=ignore_warnings,
+                concurrency=concurrency,
+                return_exceptions=return_exceptions,
+            )
+        )
 
-    def parts(
-        self, actor_id: str, part_type: Optional[str] = None, *args, **kwargs
-    ) -> pd.DataFrame:
-        """Retreive actor parts (e.g. subnational, cities, ...)
+    def _parts_endpoint(self, actor_id: str, part_type: Optional[str] = None) -> str:
+        """retrieve parts endpoint
 
         Args:
             actor_id (str): code for actor your want to retrieve
             part_type (str, optional): administrative level
 
         Returns:
-            DataFrame: data for each emissions dataset
+            str : the full parts endpoint
         """
         endpoint = f"/actor/{actor_id}/parts"
         if part_type:
@@ -104,18 +133,69 @@ class ActorOverview(Base):
                 )
 
             endpoint += f"?type={part_type}"
+        return endpoint
 
+    def parts(
+        self, actor_id: str, part_type: Optional[str] = None, backend: str = "pandas", *args, **kwargs
+    ) -> Optional[Union[pd.DataFrame, Any]]:
+        """Retreive actor parts (e.g. subnational, cities, ...)
+
+        Args:
+            actor_id (str): code for actor your want to retrieve
+            part_type (str, optional): administrative level
+            backend (str, optional): result type, one of 'pandas', 'arrow' (pyarrow.Table) or 'polars' (polars.DataFrame)
+
+        Returns:
+            DataFrame: data for each emissions dataset
+        """
+        check_backend(backend)
+        endpoint = self._parts_endpoint(actor_id=actor_id, part_type=part_type)
         url = f"{self.server}{endpoint}"
-        headers = {"Accept": "application/json"}
-        response = requests.get(url, headers=headers).json()
+        response = get_json(url, endpoint="/actor/{actor_id}/parts", compression=self.compression)
         data_list = response.get("data", None)
         if data_list is None:
             warnings.warn(f"{actor_id} is not in our database", category=SyntaxWarning)
             return None
+        elif backend != "pandas":
+            data_list = sorted(data_list, key=lambda record: (record.get("type"), record.get("actor_id")))
+            return records_to_frame(data_list, backend=backend)
         else:
             df = pd.DataFrame(data_list).sort_values(by=["type", "actor_id"])
             return df
 
+    def iter_parts(
+        self,
+        actor_id: str,
+        part_type: Optional[str] = None,
+        page_size: Optional[int] = None,
+        chunk_size: int = 65536,
+        *args,
+        **kwargs,
+    ) -> Iterator[Union[Dict[str, Any], pd.DataFrame]]:
+        """Stream actor parts (e.g. subnational, cities, ...)
+
+        The response is parsed incrementally as it is read from the socket, so
+        memory stays bounded by `page_size` regardless of the number of parts.
+        Parts are yielded in the order returned by the API, not sorted as in `parts`.
+
+        Args:
+            actor_id (str): code for actor your want to retrieve
+            part_type (str, optional): administrative level
+            page_size (int, optional): yield DataFrames of `page_size` rows instead of records
+            chunk_size (int, optional): bytes read from the socket at a time. Defaults to 65536.
+
+        Yields:
+            Dict|DataFrame: one record per part, or a DataFrame per page
+        """
+        endpoint = self._parts_endpoint(actor_id=actor_id, part_type=part_type)
+        url = f"{self.server}{endpoint}"
+        chunks = iter_content(url, endpoint="/actor/{actor_id}/parts", compression=self.compression, chunk_size=chunk_size)
+        records = iter_json_array(chunks, key="data")
+        try:
+            yield from (iter_pages(records, page_size) if page_size else records)
+        except KeyError:
+            warnings.warn(f"{actor_id} is not in our database", category=SyntaxWarning)
+
     def country_codes(
         self,
         like: Optional[str] = None,
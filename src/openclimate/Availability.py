@@ -0,0 +1,193 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+import json
+import os
+import threading
+import pandas as pd
+from typing import List, Dict, Union, Tuple, Any, Optional
+
+from .ActorOverview import ActorOverview
+from .utils import read_jsonl
+
+METRICS = ["emissions", "targets", "gdp", "population"]
+
+
+def _availability(overview: Dict[Any, Any], metric: str) -> Dict[str, Any]:
+    """years and datasources of a metric in an actor overview
+
+    targets are covered by their target years
+
+    Args:
+        overview (Dict): dictionary of overview
+        metric (str): one of 'emissions', 'targets', 'gdp' or 'population'
+
+    Returns:
+        Dict: has_data, first_year, last_year, n_years and datasources
+    """
+    if metric == "emissions":
+        rows = [
+            (row.get("year"), datasource)
+            for datasource, dataset in (overview.get("emissions") or {}).items()
+            for row in dataset.get("data") or []
+        ]
+    else:
+        year_key = "target_year" if metric == "targets" else "year"
+        rows = [(row.get(year_key), row.get("datasource_id")) for row in overview.get(metric) or []]
+    years = sorted({year for year, _ in rows if year is not None})
+    return {
+        "has_data": bool(rows),
+        "first_year": years[0] if years else None,
+        "last_year": years[-1] if years else None,
+        "n_years": len(years),
+        "datasources": sorted({datasource for _, datasource in rows if datasource}),
+    }
+
+
+@dataclass
+class AvailabilityIndex:
+    """which actors have data for which metric
+
+    The index is filled with every overview fetched through it, for all metrics
+    at once, and appended to `path` as JSON lines (the last record of an actor
+    and metric wins). Loading the file answers coverage questions without any
+    request, and metric calls given the index skip actors known to be empty.
+
+    Args:
+        path (str, optional): JSON lines file of the index, kept in memory only when None
+        max_age (float, optional): days after which an empty record is fetched again. Defaults to never.
+    """
+
+    path: Optional[str] = None
+    max_age: Optional[float] = None
+    _records: Dict[Tuple[str, str], Dict[str, Any]] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    columns = [
+        "actor_id",
+        "metric",
+        "has_data",
+        "first_year",
+        "last_year",
+        "n_years",
+        "datasources",
+        "checked",
+    ]
+
+    def __post_init__(self):
+        if self.path and os.path.exists(self.path):
+            for record in read_jsonl(self.path):
+                self._records[(record["actor_id"], record["metric"])] = record
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def update(self, actor_id: List[str], overviews: List[Any]) -> None:
+        """record the availability of every metric from fetched overviews
+
+        Only overviews that were retrieved are recorded: an actor that was not
+        found (which may also be a rate limited or failed response) or raised
+        an exception is fetched again next time.
+
+        Args:
+            actor_id (List[str]): actor codes
+            overviews (List): overview dictionary, None when the actor was not found, or the exception raised
+        """
+        checked = datetime.now(timezone.utc).isoformat()
+        records = [
+            dict(_availability(overview, metric), actor_id=actor, metric=metric, checked=checked)
+            for actor, overview in zip(actor_id, overviews)
+            if isinstance(overview, dict)
+            for metric in METRICS
+        ]
+        with self._lock:
+            for record in records:
+                self._records[(record["actor_id"], record["metric"])] = record
+            if self.path and records:
+                # line buffered, one write per record, so appends of several processes do not interleave
+                with open(self.path, "a", buffering=1) as f:
+                    for record in records:
+                        f.write(json.dumps(record) + "\n")
+
+    def known_empty(self, actor_id: Union[str, List[str], Tuple[str]], metric: str) -> List[str]:
+        """actors known to exist and to have no data for a metric
+
+        Args:
+            actor_id (Union[str, List[str], Tuple[str]]): actor code
+            metric (str): one of 'emissions', 'targets', 'gdp' or 'population'
+
+        Returns:
+            List[str]: actor codes
+        """
+        actor_list = [actor_id] if isinstance(actor_id, str) else actor_id
+        oldest = None
+        if self.max_age is not None:
+            oldest = (datetime.now(timezone.utc) - timedelta(days=self.max_age)).isoformat()
+        empty = []
+        for actor in actor_list:
+            record = self._records.get((actor, metric))
+            if record is None or record["has_data"]:
+                continue
+            if oldest is None or record["checked"] >= oldest:
+                empty.append(actor)
+        return empty
+
+    def coverage(
+        self, actor_id: Optional[Union[str, List[str], Tuple[str]]] = None, metric: Optional[str] = None
+    ) -> pd.DataFrame:
+        """availability of metrics per actor, without any request
+
+        Args:
+            actor_id (Union[str, List[str], Tuple[str]], optional): only these actors
+            metric (str, optional): only this metric
+
+        Returns:
+            pd.DataFrame: actor_id, metric, has_data, first_year, last_year, n_years, datasources and checked
+        """
+        df = pd.DataFrame(list(self._records.values()), columns=self.columns)
+        if actor_id is not None:
+            actor_list = [actor_id] if isinstance(actor_id, str) else actor_id
+            df = df.loc[df["actor_id"].isin(actor_list)]
+        if metric is not None:
+            df = df.loc[df["metric"] == metric]
+        return df.sort_values(by=["actor_id", "metric"]).reset_index(drop=True)
+
+    def compact(self) -> None:
+        """rewrite `path` with only the latest record of every actor and metric"""
+        if not self.path:
+            return
+        with self._lock:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                f.writelines(json.dumps(record) + "\n" for record in self._records.values())
+            os.replace(tmp_path, self.path)
+
+
+def fetch_overviews(
+    actor_id: Union[str, List[str], Tuple[str]],
+    metric: str,
+    availability: Optional[AvailabilityIndex] = None,
+    **kwargs,
+) -> List[Any]:
+    """actor overviews, skipping actors the availability index knows have no data for `metric`
+
+    Skipped actors get an overview without `metric` data, so callers handle
+    them as if they had been fetched.
+
+    Args:
+        actor_id (Union[str, List[str], Tuple[str]]): actor code
+        metric (str): one of 'emissions', 'targets', 'gdp' or 'population'
+        availability (AvailabilityIndex, optional): index to consult and update
+        **kwargs: arguments of `ActorOverview.overview`
+
+    Returns:
+        List: overview of each actor, in order
+    """
+    actor_list = [actor_id] if isinstance(actor_id, str) else list(actor_id)
+    if availability is None:
+        return list(ActorOverview().overview(actor_id=actor_list, **kwargs))
+    empty = set(availability.known_empty(actor_list, metric))
+    fetch_list = list(dict.fromkeys(actor for actor in actor_list if actor not in empty))
+    overviews = ActorOverview().overview(actor_id=fetch_list, **kwargs) if fetch_list else []
+    availability.update(fetch_list, overviews)
+    fetched = dict(zip(fetch_list, overviews))
+    return [fetched[actor] if actor in fetched else {"actor_id": actor} for actor in actor_list]
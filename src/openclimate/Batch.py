@@ -0,0 +1,240 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import json
+import os
+import pandas as pd
+from typing import List, Dict, Union, Tuple, Any, Optional
+import warnings
+
+from .Availability import AvailabilityIndex, fetch_overviews
+from .Base import Base
+from .Emissions import Emissions
+from .GDP import GDP
+from .Population import Population
+from .Targets import Targets
+from .utils import read_csv, read_jsonl
+
+
+@dataclass
+class BatchResult:
+    """result of a batch job
+
+    Attributes:
+        data (pd.DataFrame): metric data of every actor that finished
+        status (pd.DataFrame): latest status of every actor in the checkpoint
+    """
+
+    data: pd.DataFrame = field(default_factory=pd.DataFrame)
+    status: pd.DataFrame = field(default_factory=pd.DataFrame)
+
+    @property
+    def errors(self) -> pd.DataFrame:
+        """actors that were not found or failed"""
+        if self.status.empty:
+            return self.status
+        return self.status.loc[~self.status["status"].isin(BatchJob.final_statuses)].reset_index(drop=True)
+
+
+@dataclass
+class BatchJob(Base):
+    """BatchJob API class
+    fetch a metric for many actors with a checkpoint on disk
+
+    The checkpoint directory holds `status.jsonl`, an append-only record of the
+    outcome of every actor (the last record of an actor wins), and one
+    `part-NNNNN.csv` file of data per chunk. Running the job again with the same
+    checkpoint directory only fetches actors that are pending or failed.
+
+    Statuses:
+        ok: data was retrieved
+        no_data: the actor exists but has no data for the metric
+        not_found: the actor does not exist
+        failed: an exception was raised, see `error_type` and `message`
+
+    Args:
+        metric (str): one of 'emissions', 'targets', 'gdp' or 'population'
+        checkpoint_dir (str): directory for the checkpoint files
+        chunk_size (int): number of actors fetched between checkpoints
+        concurrency (int, optional): maximum number of simultaneous requests
+        availability (AvailabilityIndex, optional): skip actors known to have no data and record the fetched ones
+
+    Returns:
+        object
+    """
+
+    metric: str = "emissions"
+    checkpoint_dir: str = "openclimate-checkpoint"
+    chunk_size: int = 100
+    concurrency: Optional[int] = None
+    availability: Optional[AvailabilityIndex] = None
+
+    final_statuses = ("ok", "no_data")
+    column_types = {
+        "year": "int64",
+        "total_emissions": "float64",
+        "gdp": "float64",
+        "population": "float64",
+        "baseline_year": "int64",
+        "baseline_value": "float64",
+        "target_year": "int64",
+        "target_value": "float64",
+    }
+
+    def __post_init__(self):
+        if self.metric not in self._getters():
+            raise ValueError(f"MetricError: {self.metric} not in {list(self._getters())}")
+
+    def _getters(self) -> Dict[str, Any]:
+        return {
+            "emissions": Emissions()._get_emissions,
+            "targets": Targets()._get_target,
+            "gdp": GDP()._get_gdp,
+            "population": Population()._get_population,
+        }
+
+    def _columns(self) -> List[str]:
+        return {
+            "emissions": Emissions.columns,
+            "targets": [Targets.renames.get(col, col) for col in Targets.columns],
+            "gdp": GDP.columns,
+            "population": Population.columns,
+        }[self.metric]
+
+    @property
+    def schema(self) -> Dict[str, str]:
+        """columns of the metric data and their arrow types, the same for every actor"""
+        return {col: self.column_types.get(col, "string") for col in self._columns()}
+
+    @property
+    def _status_path(self) -> str:
+        return os.path.join(self.checkpoint_dir, "status.jsonl")
+
+    def _part_path(self, part: str) -> str:
+        return os.path.join(self.checkpoint_dir, part)
+
+    def _read_part(self, part: str) -> pd.DataFrame:
+        df: pd.DataFrame = read_csv(self._part_path(part))
+        return df
+
+    def _next_part(self) -> str:
+        """name of the next data part file"""
+        existing = [name for name in os.listdir(self.checkpoint_dir) if name.startswith("part-")]
+        return f"part-{len(existing):05d}.csv"
+
+    def status(self) -> pd.DataFrame:
+        """latest status of every actor in the checkpoint
+
+        Returns:
+            pd.DataFrame: actor_id, status, error_type, message, part and timestamp columns
+        """
+        columns = ["actor_id", "status", "error_type", "message", "part", "timestamp"]
+        if not os.path.exists(self._status_path):
+            return pd.DataFrame(columns=columns)
+        df = pd.DataFrame(read_jsonl(self._status_path), columns=columns)
+        return df.drop_duplicates(subset=["actor_id"], keep="last").reset_index(drop=True)
+
+    def pending(self, actor_id: Union[str, List[str], Tuple[str]]) -> List[str]:
+        """actors that still have to be fetched
+
+        Args:
+            actor_id (Union[str, List[str], Tuple[str]]): actor code
+
+        Returns:
+            List[str]: actors without a final status in the checkpoint
+        """
+        actor_list = [actor_id] if isinstance(actor_id, str) else actor_id
+        status = self.status()
+        done = set(status.loc[status["status"].isin(self.final_statuses), "actor_id"])
+        return list(dict.fromkeys(actor for actor in actor_list if actor not in done))
+
+    def _process(self, actor: str, overview: Any) -> Tuple[Dict[str, Any], Optional[pd.DataFrame]]:
+        """status record and data of a single actor
+
+        Args:
+            actor (str): actor code
+            overview (Any): overview dictionary, None or the exception raised
+
+        Returns:
+            Tuple[Dict, pd.DataFrame]: status record and data
+        """
+        record: Dict[str, Any] = {"actor_id": actor, "status": "ok", "error_type": None, "message": None}
+        if isinstance(overview, BaseException):
+            record.update(status="failed", error_type=type(overview).__name__, message=str(overview))
+            return record, None
+        if overview is None:
+            record.update(status="not_found", message=f"{actor} was not found")
+            return record, None
+        if not overview.get(self.metric):
+            record.update(status="no_data", message=f"{actor} has no {self.metric} data")
+            return record, None
+        try:
+            df = self._getters()[self.metric](overview)
+        except Exception as e:
+            record.update(status="failed", error_type=type(e).__name__, message=str(e))
+            return record, None
+        # actors without some fields (e.g. targets without an initiative) still get every column
+        return record, df.reindex(columns=self._columns())
+
+    def _run_chunk(self, actor_list: List[str]) -> None:
+        """fetch a chunk of actors and write it to the checkpoint
+
+        The data part is written before the status records that point to it, so
+        an interrupted run never marks an actor as finished without its data.
+
+        Args:
+            actor_list (List[str]): actor codes
+        """
+        with warnings.catch_warnings():
+            overviews = fetch_overviews(
+                actor_list,
+                self.metric,
+                self.availability,
+                ignore_warnings=True,
+                concurrency=self.concurrency,
+                return_exceptions=True,
+            )
+        results = [self._process(actor, overview) for actor, overview in zip(actor_list, overviews)]
+
+        df_list = [df for _, df in results if df is not None]
+        part = None
+        if df_list:
+            part = self._next_part()
+            tmp_path = self._part_path(f".{part}.tmp")
+            pd.concat(df_list, ignore_index=True).to_csv(tmp_path, index=False)
+            os.replace(tmp_path, self._part_path(part))
+
+        timestamp = datetime.now(timezone.utc).isoformat()
+        with open(self._status_path, "a") as f:
+            for record, df in results:
+                record.update(part=part if df is not None else None, timestamp=timestamp)
+                f.write(json.dumps(record) + "\n")
+
+    def result(self) -> BatchResult:
+        """load the data and status of the checkpoint
+
+        Returns:
+            BatchResult
+        """
+        status = self.status()
+        ok = status.loc[status["status"] == "ok", ["actor_id", "part"]]
+        df_list = [
+            self._read_part(str(part)).loc[lambda x: x["actor_id"].isin(actors["actor_id"])]
+            for part, actors in ok.groupby("part")
+        ]
+        data = pd.concat(df_list, ignore_index=True) if df_list else pd.DataFrame()
+        return BatchResult(data=data, status=status)
+
+    def run(self, actor_id: Union[str, List[str], Tuple[str]]) -> BatchResult:
+        """fetch the metric for all actors, resuming from the checkpoint
+
+        Args:
+            actor_id (Union[str, List[str], Tuple[str]]): actor code
+
+        Returns:
+            BatchResult: data of finished actors and status of every actor
+        """
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        actor_list = self.pending(actor_id)
+        for start in range(0, len(actor_list), self.chunk_size):
+            self._run_chunk(actor_list[start:start + self.chunk_size])
+        return self.result()
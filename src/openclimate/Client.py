@@ -1,14 +1,21 @@
 from dataclasses import dataclass
 import pandas as pd
-from typing import Optional
+from typing import List, Dict, Tuple, Any, Iterator, Optional, Union
 
 from .ActorOverview import ActorOverview
+from .Availability import AvailabilityIndex
 from .Base import Base
+from .Batch import BatchJob, BatchResult
+from .Diff import Diff, DiffResult
 from .Emissions import Emissions
 from .GDP import GDP
+from .Panel import Panel
 from .Population import Population
+from .Progress import Progress
+from .Rollup import Rollup, RollupResult
 from .Search import Search
 from .Targets import Targets
+from .Transfer import transfer_stats
 
 
 @dataclass
@@ -37,71 +44,255 @@ class Client(Base):
         nest_asyncio.apply()
 
     def emissions(
-        self, actor_id: str, datasource_id: Optional[str] = None, ignore_warnings: bool = False
-    ) -> pd.DataFrame:
+        self,
+        actor_id: str,
+        datasource_id: Optional[str] = None,
+        ignore_warnings: bool = False,
+        normalize: bool = False,
+        backend: str = "pandas",
+        availability: Optional[AvailabilityIndex] = None,
+    ) -> Union[pd.DataFrame, Tuple[pd.DataFrame, pd.DataFrame], Any]:
         """retreive actor emissions
 
         Args:
             actor_id (str|List[str]): code for actor your want to retrieve
             datasource_id (str): code emissions dataset
             ignore_warnings (bool): ignore warning messages
+            normalize (bool): return a fact table with a datasource_key and a datasource table
+            backend (str): result type, one of 'pandas', 'arrow' (pyarrow.Table) or 'polars' (polars.DataFrame)
+            availability (AvailabilityIndex): skip actors known to have no data and record the fetched ones
 
         Returns:
-            DataFrame: data for each emissions dataset
+            DataFrame: data for each emissions dataset, or (facts, datasources) if normalize is True
         """
-        return Emissions().emissions(actor_id=actor_id, datasource_id=datasource_id, ignore_warnings=ignore_warnings)
+        return Emissions().emissions(
+            actor_id=actor_id,
+            datasource_id=datasource_id,
+            ignore_warnings=ignore_warnings,
+            normalize=normalize,
+            backend=backend,
+            availability=availability,
+        )
 
-    def emissions_datasets(self, actor_id: str, ignore_warnings: bool = False) -> pd.DataFrame:
+    def emissions_datasets(
+        self, actor_id: str, ignore_warnings: bool = False, normalize: bool = False
+    ) -> Optional[Union[pd.DataFrame, Tuple[pd.DataFrame, pd.DataFrame]]]:
         """retreive actor emissions datasets
 
         Args:
             actor_id (str): code for actor your want to retrieve
             ignore_warnings (bool): ignore warning messages
+            normalize (bool): return actor_id and datasource_key pairs and a datasource table
 
         Returns:
-            DataFrame: data of emission datasets
+            DataFrame: data of emission datasets, or (facts, datasources) if normalize is True
         """
-        return Emissions().datasets(actor_id=actor_id, ignore_warnings=ignore_warnings)
+        return Emissions().datasets(actor_id=actor_id, ignore_warnings=ignore_warnings, normalize=normalize)
 
-    def targets(self, actor_id: str, ignore_warnings: bool = False) -> pd.DataFrame:
+    def targets(
+        self,
+        actor_id: str,
+        ignore_warnings: bool = False,
+        normalize: bool = False,
+        backend: str = "pandas",
+        availability: Optional[AvailabilityIndex] = None,
+    ) -> Union[pd.DataFrame, Tuple[pd.DataFrame, pd.DataFrame], Any]:
         """retreive actor targets
 
         Args:
             actor_id (str|List[str]): code for actor your want to retrieve
             ignore_warnings (bool): ignore warning messages
+            normalize (bool): return a fact table with a datasource_key and a datasource table
+            backend (str): result type, one of 'pandas', 'arrow' (pyarrow.Table) or 'polars' (polars.DataFrame)
+            availability (AvailabilityIndex): skip actors known to have no data and record the fetched ones
 
         Returns:
-            DataFrame: dataframe of targets
+            DataFrame: dataframe of targets, or (facts, datasources) if normalize is True
         """
-        return Targets().targets(actor_id=actor_id, ignore_warnings=ignore_warnings)
+        return Targets().targets(
+            actor_id=actor_id,
+            ignore_warnings=ignore_warnings,
+            normalize=normalize,
+            backend=backend,
+            availability=availability,
+        )
+
+    def progress(
+        self,
+        actor_id: str,
+        datasource_id: Optional[Union[str, List[str]]] = None,
+        trend_years: int = 5,
+        ignore_warnings: bool = False,
+    ) -> Optional[pd.DataFrame]:
+        """retreive actor progress towards targets
 
-    def population(self, actor_id: str, ignore_warnings: bool = False) -> pd.DataFrame:
+        compares targets with reported emissions: reduction to date, required annual
+        reduction rate, linear extrapolation to the target year and an on-track flag
+
+        Args:
+            actor_id (str|List[str]): code for actor your want to retrieve
+            datasource_id (str|List[str]): emissions datasource, or list in order of preference
+            trend_years (int): number of recent years used for the extrapolation
+            ignore_warnings (bool): ignore warning messages
+
+        Returns:
+            DataFrame: dataframe of targets with progress columns
+        """
+        return Progress().progress(
+            actor_id=actor_id, datasource_id=datasource_id, trend_years=trend_years, ignore_warnings=ignore_warnings
+        )
+
+    def population(
+        self,
+        actor_id: str,
+        ignore_warnings: bool = False,
+        normalize: bool = False,
+        backend: str = "pandas",
+        availability: Optional[AvailabilityIndex] = None,
+    ) -> Union[pd.DataFrame, Tuple[pd.DataFrame, pd.DataFrame], Any]:
         """retreive actor population
 
         Args:
             actor_id (str|List[str]): code for actor your want to retrieve
             ignore_warnings (bool): ignore warning messages
+            normalize (bool): return a fact table with a datasource_key and a datasource table
+            backend (str): result type, one of 'pandas', 'arrow' (pyarrow.Table) or 'polars' (polars.DataFrame)
+            availability (AvailabilityIndex): skip actors known to have no data and record the fetched ones
 
         Returns:
-            DataFrame: dataframe of population
+            DataFrame: dataframe of population, or (facts, datasources) if normalize is True
         """
-        return Population().population(actor_id=actor_id, ignore_warnings=ignore_warnings)
+        return Population().population(
+            actor_id=actor_id,
+            ignore_warnings=ignore_warnings,
+            normalize=normalize,
+            backend=backend,
+            availability=availability,
+        )
 
-    def gdp(self, actor_id: str, ignore_warnings: bool = False) -> pd.DataFrame:
+    def gdp(
+        self,
+        actor_id: str,
+        ignore_warnings: bool = False,
+        normalize: bool = False,
+        backend: str = "pandas",
+        availability: Optional[AvailabilityIndex] = None,
+    ) -> Union[pd.DataFrame, Tuple[pd.DataFrame, pd.DataFrame], Any]:
         """retreive actor GDP
 
         Args:
             actor_id (str|List[str]): code for actor your want to retrieve
             ignore_warnings (bool): ignore warning messages
+            normalize (bool): return a fact table with a datasource_key and a datasource table
+            backend (str): result type, one of 'pandas', 'arrow' (pyarrow.Table) or 'polars' (polars.DataFrame)
+            availability (AvailabilityIndex): skip actors known to have no data and record the fetched ones
 
         Returns:
-            DataFrame: dataframe of GDP
+            DataFrame: dataframe of GDP, or (facts, datasources) if normalize is True
         """
-        return GDP().gdp(actor_id=actor_id, ignore_warnings=ignore_warnings)
+        return GDP().gdp(
+            actor_id=actor_id,
+            ignore_warnings=ignore_warnings,
+            normalize=normalize,
+            backend=backend,
+            availability=availability,
+        )
 
-    def parts(
-        self, actor_id: str, part_type: Optional[str] = None, *args, **kwargs
+    def panel(
+        self,
+        actor_id: str,
+        emissions_datasource_id: Optional[Union[str, List[str]]] = None,
+        gdp_datasource_id: Optional[Union[str, List[str]]] = None,
+        population_datasource_id: Optional[Union[str, List[str]]] = None,
+        wide: bool = False,
+        ignore_warnings: bool = False,
     ) -> pd.DataFrame:
+        """retreive an aligned actor x year panel of emissions, GDP and population
+
+        includes per-capita emissions, emissions intensity and year-over-year changes
+
+        Args:
+            actor_id (str|List[str]): code for actor your want to retrieve
+            emissions_datasource_id (str|List[str]): emissions datasource, or list in order of preference
+            gdp_datasource_id (str|List[str]): GDP datasource, or list in order of preference
+            population_datasource_id (str|List[str]): population datasource, or list in order of preference
+            wide (bool): return year rows with (variable, actor_id) columns
+            ignore_warnings (bool): ignore warning messages
+
+        Returns:
+            DataFrame: dataframe with one row per actor and year
+        """
+        return Panel().panel(
+            actor_id=actor_id,
+            emissions_datasource_id=emissions_datasource_id,
+            gdp_datasource_id=gdp_datasource_id,
+            population_datasource_id=population_datasource_id,
+            wide=wide,
+            ignore_warnings=ignore_warnings,
+        )
+
+    def batch(
+        self,
+        actor_id: str,
+        metric: str = "emissions",
+        checkpoint_dir: str = "openclimate-checkpoint",
+        chunk_size: int = 100,
+        concurrency: Optional[int] = None,
+        availability: Optional[AvailabilityIndex] = None,
+    ) -> BatchResult:
+        """retreive a metric for many actors with a checkpoint on disk
+
+        finished actors are saved to `checkpoint_dir` as the job goes, failures are
+        recorded per actor. Running again with the same `checkpoint_dir` only fetches
+        actors that are still pending or failed.
+
+        Args:
+            actor_id (str|List[str]): code for actor your want to retrieve
+            metric (str): one of 'emissions', 'targets', 'gdp' or 'population'
+            checkpoint_dir (str): directory for the checkpoint files
+            chunk_size (int): number of actors fetched between checkpoints
+            concurrency (int): maximum number of simultaneous requests
+            availability (AvailabilityIndex): skip actors known to have no data and record the fetched ones
+
+        Returns:
+            BatchResult: `data` of finished actors, `status` and `errors` per actor
+        """
+        return BatchJob(
+            metric=metric,
+            checkpoint_dir=checkpoint_dir,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            availability=availability,
+        ).run(actor_id=actor_id)
+
+    def diff(
+        self,
+        old: Union[pd.DataFrame, str],
+        new: Union[pd.DataFrame, str],
+        metric: str = "emissions",
+        keys: Optional[List[str]] = None,
+        values: Optional[List[str]] = None,
+    ) -> DiffResult:
+        """compare two pulls of a metric
+
+        rows are matched on their keys (actor_id, year and datasource_id for
+        emissions, gdp and population) and reported as added, removed or changed
+
+        Args:
+            old (DataFrame|str): earlier result, or path of a csv, jsonl or parquet snapshot
+            new (DataFrame|str): later result, or path of a csv, jsonl or parquet snapshot
+            metric (str): one of 'emissions', 'targets', 'gdp' or 'population'
+            keys (List[str]): columns identifying a row (optional)
+            values (List[str]): compared value columns (optional)
+
+        Returns:
+            DiffResult: `added`, `removed` and `changed` rows with value deltas
+        """
+        return Diff().diff(old=old, new=new, metric=metric, keys=keys, values=values)
+
+    def parts(
+        self, actor_id: str, part_type: Optional[str] = None, backend: str = "pandas", *args, **kwargs
+    ) -> Optional[Union[pd.DataFrame, Any]]:
         """retreive actor parts
 
         returns subnational, cities, companies, etc. within an actor_id
@@ -109,11 +300,58 @@ class Client(Base):
         Args:
             actor_id (str|List[str]): code for actor your want to retrieve
             part_type (str): retrieve actors from administrative part ['planet', 'country', 'adm1', 'adm2', 'city', 'organization', 'site']
+            backend (str): result type, one of 'pandas', 'arrow' (pyarrow.Table) or 'polars' (polars.DataFrame)
 
         Returns:
             DataFrame: dataframe of actors parts
         """
-        return ActorOverview().parts(actor_id=actor_id, part_type=part_type)
+        return ActorOverview().parts(actor_id=actor_id, part_type=part_type, backend=backend)
+
+    def rollup(
+        self,
+        actor_id: str,
+        metric: str = "emissions",
+        part_type: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        ignore_warnings: bool = False,
+    ) -> Optional[RollupResult]:
+        """sum the parts of an actor and compare with the actor's reported values
+
+        Args:
+            actor_id (str): code of the parent actor
+            metric (str): one of 'emissions', 'gdp' or 'population'
+            part_type (str): only include parts of this administrative level ['adm1', 'adm2', 'city', ...]
+            concurrency (int): maximum number of simultaneous requests
+            ignore_warnings (bool): ignore warning messages
+
+        Returns:
+            RollupResult: `totals` per part type, year and datasource, and `coverage` of each part
+        """
+        return Rollup().rollup(
+            actor_id=actor_id,
+            metric=metric,
+            part_type=part_type,
+            concurrency=concurrency,
+            ignore_warnings=ignore_warnings,
+        )
+
+    def iter_parts(
+        self, actor_id: str, part_type: Optional[str] = None, page_size: Optional[int] = None, *args, **kwargs
+    ) -> Iterator[Union[Dict[str, Any], pd.DataFrame]]:
+        """stream actor parts
+
+        parses the response incrementally so memory stays bounded for actors with
+        many parts (e.g. 'EARTH' without a part_type)
+
+        Args:
+            actor_id (str): code for actor your want to retrieve
+            part_type (str): retrieve actors from administrative part ['planet', 'country', 'adm1', 'adm2', 'city', 'organization', 'site']
+            page_size (int): yield dataframes of `page_size` rows instead of records
+
+        Returns:
+            Iterator[Dict|DataFrame]: records or dataframes of actors parts
+        """
+        return ActorOverview().iter_parts(actor_id=actor_id, part_type=part_type, page_size=page_size)
 
     def search(
         self,
@@ -122,9 +360,10 @@ class Client(Base):
         query: Optional[str] = None,
         language: Optional[str] = None,
         namespace: Optional[str] = None,
+        backend: str = "pandas",
         *args,
         **kwargs,
-    ) -> pd.DataFrame:
+    ) -> Union[pd.DataFrame, Any]:
         """search actor names and identifiers
 
         Args:
@@ -133,6 +372,7 @@ class Client(Base):
             language (str, optional): two letter language code [requires name to be set]
             identifier (str): searches for actors with exact identifier code match (e.g. "US")
             namespace (str, optional): actor namespace code [requires identifier to be be set]
+            backend (str): result type, one of 'pandas', 'arrow' (pyarrow.Table) or 'polars' (polars.DataFrame)
 
         Returns:
             DataFrame: dataframe of search results
@@ -143,8 +383,62 @@ class Client(Base):
             query=query,
             language=language,
             namespace=namespace,
+            backend=backend,
+        )
+
+    def iter_search(
+        self,
+        name: Optional[str] = None,
+        identifier: Optional[str] = None,
+        query: Optional[str] = None,
+        language: Optional[str] = None,
+        namespace: Optional[str] = None,
+        page_size: Optional[int] = None,
+        *args,
+        **kwargs,
+    ) -> Iterator[Union[Dict[str, Any], pd.DataFrame]]:
+        """stream search results
+
+        parses the response incrementally so memory stays bounded for broad queries
+
+        Args:
+            query (str): full search of identifiers and names that include the search parameter
+            name (str): searches for actors with exact name match (e.g. "Minnesota")
+            language (str, optional): two letter language code [requires name to be set]
+            identifier (str): searches for actors with exact identifier code match (e.g. "US")
+            namespace (str, optional): actor namespace code [requires identifier to be be set]
+            page_size (int): yield dataframes of `page_size` rows instead of records
+
+        Returns:
+            Iterator[Dict|DataFrame]: records or dataframes of search results
+        """
+        return Search().iter_search(
+            name=name,
+            identifier=identifier,
+            query=query,
+            language=language,
+            namespace=namespace,
+            page_size=page_size,
         )
 
+    def transfer_stats(self, reset: bool = False) -> pd.DataFrame:
+        """bytes transferred per endpoint
+
+        responses are requested compressed (gzip, deflate, and br/zstd when `brotli`
+        or `zstandard` is installed), `wire_bytes` is the compressed size and
+        `decoded_bytes` the decompressed size
+
+        Args:
+            reset (bool): reset the counters after reading them
+
+        Returns:
+            DataFrame: requests, wire_bytes, decoded_bytes, saved_bytes and compression_ratio per endpoint
+        """
+        df = transfer_stats.to_frame()
+        if reset:
+            transfer_stats.reset()
+        return df
+
     def country_codes(
         self,
         like: Optional[str] = None,
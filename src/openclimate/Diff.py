@@ -0,0 +1,286 @@
+from dataclasses import dataclass, field
+import numpy as np
+import pandas as pd
+from typing import List, Dict, Union, Iterator, Optional
+
+from .Base import Base
+from .utils import read_csv
+
+Source = Union[pd.DataFrame, str]
+
+
+@dataclass
+class DiffResult:
+    """revision diff between two pulls of a metric
+
+    Attributes:
+        keys (List[str]): columns identifying a row
+        values (List[str]): compared value columns
+        added (pd.DataFrame): rows only in the new pull
+        removed (pd.DataFrame): rows only in the old pull
+        changed (pd.DataFrame): keys with `<value>_old`, `<value>_new` and, for numeric values, `<value>_delta` columns
+        unchanged (int): number of rows in both pulls with the same values
+    """
+
+    keys: List[str] = field(default_factory=list)
+    values: List[str] = field(default_factory=list)
+    added: pd.DataFrame = field(default_factory=pd.DataFrame)
+    removed: pd.DataFrame = field(default_factory=pd.DataFrame)
+    changed: pd.DataFrame = field(default_factory=pd.DataFrame)
+    unchanged: int = 0
+
+    @property
+    def summary(self) -> Dict[str, int]:
+        """number of added, removed, changed and unchanged rows"""
+        return {
+            "added": len(self.added),
+            "removed": len(self.removed),
+            "changed": len(self.changed),
+            "unchanged": self.unchanged,
+        }
+
+    def to_frame(self) -> pd.DataFrame:
+        """added, removed and changed rows in one dataframe with a `change` column
+
+        Returns:
+            pd.DataFrame: change, keys and old, new and delta value columns
+        """
+        columns = self.keys + self.values
+        added = self.added.loc[:, columns].rename(columns={col: f"{col}_new" for col in self.values})
+        removed = self.removed.loc[:, columns].rename(columns={col: f"{col}_old" for col in self.values})
+        df_list = [
+            df.assign(change=change)
+            for change, df in [("added", added), ("removed", removed), ("changed", self.changed)]
+            if not df.empty
+        ]
+        columns = ["change"] + self.keys + list(self.changed.columns.drop(self.keys, errors="ignore"))
+        if not df_list:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(df_list, ignore_index=True).reindex(columns=columns)
+
+
+@dataclass
+class Diff(Base):
+    """Diff API class
+    compare two pulls of a metric and report added, removed and changed rows
+
+    Rows are matched on a 64-bit hash of their key columns and compared on a
+    hash of their value columns, so only two integers are kept per row while
+    comparing. Saved snapshots (csv, jsonl or parquet) are read in chunks
+    twice: once to hash, and once to select the rows that differ.
+
+    Args:
+        chunk_size (int): rows read at a time from saved snapshots
+
+    Returns:
+        object
+    """
+
+    chunk_size: int = 1_000_000
+
+    keys = {
+        "emissions": ["actor_id", "year", "datasource_id"],
+        "gdp": ["actor_id", "year", "datasource_id"],
+        "population": ["actor_id", "year", "datasource_id"],
+        "targets": ["actor_id", "datasource_id", "initiative_id", "target_type", "baseline_year", "target_year"],
+    }
+    values = {
+        "emissions": ["total_emissions"],
+        "gdp": ["gdp"],
+        "population": ["population"],
+        "targets": ["baseline_value", "target_value", "target_unit"],
+    }
+    text_columns = ["actor_id", "datasource_id", "initiative_id", "target_type", "target_unit"]
+    sample_rows = 1000
+
+    def _iter_chunks(self, source: Source) -> Iterator[pd.DataFrame]:
+        """dataframe chunks of a result or a saved snapshot
+
+        Args:
+            source (Union[pd.DataFrame, str]): dataframe or path of a csv, jsonl or parquet file
+
+        Yields:
+            pd.DataFrame: consecutive rows of the source
+        """
+        if isinstance(source, pd.DataFrame):
+            for start in range(0, max(len(source), 1), self.chunk_size):
+                yield source.iloc[start:start + self.chunk_size]
+        elif source.endswith(".parquet"):
+            import pyarrow.parquet as pq
+
+            for batch in pq.ParquetFile(source).iter_batches(batch_size=self.chunk_size):
+                yield batch.to_pandas()
+        elif source.endswith((".jsonl", ".json")):
+            with pd.read_json(source, lines=True, chunksize=self.chunk_size, dtype=False) as reader:
+                yield from reader
+        else:
+            with read_csv(source, self.text_columns, chunksize=self.chunk_size) as reader:
+                yield from reader
+
+    def _head(self, source: Source) -> pd.DataFrame:
+        """first `sample_rows` rows of a source, to read its columns and dtypes
+
+        Args:
+            source (Union[pd.DataFrame, str]): dataframe or path of a csv, jsonl or parquet file
+
+        Returns:
+            pd.DataFrame
+        """
+        if isinstance(source, pd.DataFrame):
+            return source.head(self.sample_rows)
+        if source.endswith(".parquet"):
+            import pyarrow.parquet as pq
+
+            parquet = pq.ParquetFile(source)
+            batch = next(parquet.iter_batches(batch_size=self.sample_rows), None)
+            df: pd.DataFrame = (batch if batch is not None else parquet.schema_arrow.empty_table()).to_pandas()
+        elif source.endswith((".jsonl", ".json")):
+            df = pd.read_json(source, lines=True, nrows=self.sample_rows, dtype=False)
+        else:
+            df = read_csv(source, self.text_columns, nrows=self.sample_rows)
+        return df
+
+    def _normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """same dtypes for a column whether it came from the API or a snapshot
+
+        numbers are compared as float64 (a year column with missing values is
+        float64 in a csv, a value column with None is object in a result) and
+        text columns as python objects
+        """
+        columns = {}
+        for col in df.columns:
+            series = df[col]
+            if col not in self.text_columns and not pd.api.types.is_numeric_dtype(series):
+                numbers = pd.to_numeric(series, errors="coerce")
+                if numbers.notna().sum() == series.notna().sum():
+                    series = numbers
+            is_numeric = col not in self.text_columns and pd.api.types.is_numeric_dtype(series)
+            columns[col] = series.astype("float64") if is_numeric else series.astype(object)
+        return pd.DataFrame(columns, index=df.index)
+
+    def _hash(self, source: Source, keys: List[str], values: List[str]) -> pd.DataFrame:
+        """key hash and value hash of every row
+
+        Args:
+            source (Union[pd.DataFrame, str]): dataframe or snapshot path
+            keys (List[str]): key columns
+            values (List[str]): value columns
+
+        Returns:
+            pd.DataFrame: value hash indexed by key hash, in source order
+        """
+        df_list = []
+        for chunk in self._iter_chunks(source):
+            chunk = self._normalize(chunk.loc[:, keys + values])
+            df = pd.DataFrame(
+                {"value_hash": pd.util.hash_pandas_object(chunk[values], index=False).to_numpy()},
+                index=pd.Index(pd.util.hash_pandas_object(chunk[keys], index=False).to_numpy(), name="key_hash"),
+            )
+            df_list.append(df)
+        df = pd.concat(df_list)
+        if not df.index.is_unique:
+            n_duplicates = int(df.index.duplicated().sum())
+            raise ValueError(f"DuplicateKeyError: {n_duplicates} rows share their {keys} with another row")
+        return df
+
+    def _select(self, source: Source, mask: np.ndarray) -> pd.DataFrame:
+        """rows of the source where `mask` is True, in source order
+
+        Args:
+            source (Union[pd.DataFrame, str]): dataframe or snapshot path
+            mask (np.ndarray): boolean mask with one entry per row
+
+        Returns:
+            pd.DataFrame
+        """
+        if isinstance(source, pd.DataFrame):
+            return source.loc[mask].reset_index(drop=True)
+        df_list, start = [], 0
+        for chunk in self._iter_chunks(source):
+            chunk_mask = mask[start:start + len(chunk)]
+            start += len(chunk)
+            if chunk_mask.any():
+                df_list.append(chunk.loc[chunk_mask])
+        return pd.concat(df_list, ignore_index=True)
+
+    def diff(
+        self,
+        old: Source,
+        new: Source,
+        metric: str = "emissions",
+        keys: Optional[List[str]] = None,
+        values: Optional[List[str]] = None,
+    ) -> DiffResult:
+        """compare two pulls of a metric
+
+        Args:
+            old (Union[pd.DataFrame, str]): earlier result or path of a saved snapshot
+            new (Union[pd.DataFrame, str]): later result or path of a saved snapshot
+            metric (str): one of 'emissions', 'targets', 'gdp' or 'population'. Defaults to 'emissions'.
+            keys (List[str], optional): columns identifying a row. Defaults to the keys of the metric.
+            values (List[str], optional): compared value columns. Defaults to the values of the metric.
+
+        Returns:
+            DiffResult: added, removed and changed rows
+        """
+        if metric not in self.keys:
+            raise ValueError(f"MetricError: {metric} not in {list(self.keys)}")
+
+        new_head = self._head(new)
+        old_columns, new_columns = list(self._head(old).columns), list(new_head.columns)
+        keys = [col for col in (keys or self.keys[metric]) if col in old_columns and col in new_columns]
+        values = [col for col in (values or self.values[metric]) if col in old_columns and col in new_columns]
+        if not keys or not values:
+            raise ValueError(f"ColumnError: no key or value columns of {metric} in both pulls")
+
+        sample = self._normalize(new_head.loc[:, values])
+        numeric = [col for col in values if pd.api.types.is_numeric_dtype(sample[col])]
+
+        old_hashes = self._hash(old, keys, values)
+        new_hashes = self._hash(new, keys, values)
+
+        # position of every new row in the old pull, -1 if it was added
+        old_position = old_hashes.index.get_indexer(new_hashes.index)
+        matched = old_position >= 0
+        added = ~matched
+        removed = np.ones(len(old_hashes), dtype=bool)
+        removed[old_position[matched]] = False
+
+        changed = np.zeros(len(new_hashes), dtype=bool)
+        changed[matched] = (
+            new_hashes["value_hash"].to_numpy()[matched] != old_hashes["value_hash"].to_numpy()[old_position[matched]]
+        )
+        # pairs of changed rows, ordered by their position in the old pull
+        new_changed = np.flatnonzero(changed)
+        old_changed = old_position[new_changed]
+        order = np.argsort(old_changed, kind="stable")
+        old_changed_mask = np.zeros(len(old_hashes), dtype=bool)
+        old_changed_mask[old_changed] = True
+
+        changed_columns = keys + [
+            f"{col}_{suffix}"
+            for col in values
+            for suffix in (("old", "new", "delta") if col in numeric else ("old", "new"))
+        ]
+        changed_df = pd.DataFrame(columns=changed_columns)
+        if len(new_changed):
+            new_rows = self._select(new, changed).iloc[order].reset_index(drop=True)
+            old_rows = self._select(old, old_changed_mask)
+            changed_df = new_rows.loc[:, keys].copy()
+            for col in values:
+                changed_df[f"{col}_old"] = old_rows[col].to_numpy()
+                changed_df[f"{col}_new"] = new_rows[col].to_numpy()
+                if col in numeric:
+                    changed_df[f"{col}_delta"] = (
+                        new_rows[col].to_numpy("float64") - old_rows[col].to_numpy("float64")
+                    )
+
+        empty = pd.DataFrame(columns=new_columns)
+        return DiffResult(
+            keys=keys,
+            values=values,
+            added=self._select(new, added) if added.any() else empty,
+            removed=self._select(old, removed) if removed.any() else pd.DataFrame(columns=old_columns),
+            changed=changed_df,
+            unchanged=int(matched.sum() - len(new_changed)),
+        )
@@ -2,12 +2,19 @@ from dataclasses import dataclass
 import pandas as pd
 from typing import List, Dict, Union, Tuple, Any, Optional
 
+from .utils import filter_overviews
+from .utils import normalize_datasources
+from .utils import check_backend, records_to_frame
+
 from .ActorOverview import ActorOverview
+from .Availability import AvailabilityIndex, fetch_overviews
 from .Base import Base
 
 
 @dataclass
 class Emissions(Base):
+    columns = ["actor_id", "year", "total_emissions", "datasource_id"]
+
     def _get_emissions(self, overview: Dict[Any, Any]) -> pd.DataFrame:
         """retreive emissions from overview dictionary
 
@@ -24,31 +31,87 @@ class Emissions(Base):
             )
             data.append(df_tmp)
 
-        columns = ["actor_id", "year", "total_emissions", "datasource_id"]
         df_out = (
             pd.concat(data)
             .sort_values(by=["emissions_id"])
             .assign(actor_id=overview["actor_id"])
             .drop(columns=["tags", "emissions_id"])
-            .loc[:, columns]
+            .loc[:, self.columns]
         )
         return df_out.reset_index(drop=True)
 
+    def _records_emissions(self, overview: Dict[Any, Any], datasource_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """retreive flat emissions records from overview dictionary
+
+        Args:
+            overview (Dict): dictionary of overview
+            datasource_id (str, optional): only include this datasource
+
+        Returns:
+            List[Dict]: records sorted by emissions_id
+        """
+        rows = [
+            (row["emissions_id"], dataset, row)
+            for dataset, data in overview["emissions"].items()
+            if datasource_id is None or dataset == datasource_id
+            for row in data["data"]
+        ]
+        return [
+            {
+                "actor_id": overview["actor_id"],
+                "year": row["year"],
+                "total_emissions": row["total_emissions"],
+                "datasource_id": dataset,
+            }
+            for _, dataset, row in sorted(rows, key=lambda x: x[0])
+        ]
+
+    def _datasets_records(self, overviews: List[Dict[Any, Any]]) -> List[Dict[str, Any]]:
+        """emissions datasets of each actor in overview dictionaries
+
+        Args:
+            overviews (List[Dict]): list of actor overviews
+
+        Returns:
+            List[Dict]: one record per actor and datasource
+        """
+        return [
+            {
+                "actor_id": overview.get("actor_id"),
+                "datasource_id": datasource,
+                "name": data.get("name"),
+                "publisher": data.get("publisher"),
+                "published": data.get("published"),
+                "URL": data.get("URL"),
+            }
+            for overview in overviews
+            if overview
+            for datasource, data in overview.get("emissions", {}).items()
+        ]
+
+    def _datasources(self, df_datasets: pd.DataFrame) -> pd.DataFrame:
+        """datasource table from the output of `datasets`"""
+        return df_datasets.drop(columns=["actor_id"]).rename(
+            columns={col: f"datasource_{col}" for col in ["name", "publisher", "published", "URL"]}
+        )
+
     def datasets(
         self,
         actor_id: Union[str, List[str], Tuple[str]],
         ignore_warnings: bool = False,
+        normalize: bool = False,
         *args,
         **kwargs,
-    ) -> pd.DataFrame:
+    ) -> Optional[Union[pd.DataFrame, Tuple[pd.DataFrame, pd.DataFrame]]]:
         """retreive emissions datasets for an actor
 
         Args:
             actor_id (Union[str, List[str], Tuple[str]], optional): actor code
             ignore_warnings (bool, optional): ignore warnings messages
+            normalize (bool, optional): return actor_id and datasource_key pairs and a datasource table
 
         Returns:
-            pd.DataFrame:
+            pd.DataFrame: or a tuple of the fact and datasource tables if normalize is True
         """
         try:
             actor_id = [actor_id] if isinstance(actor_id, str) else actor_id
@@ -58,21 +121,14 @@ class Emissions(Base):
         except Exception:
             print(f"Something went wrong, check that {actor_id} is an actor")
         else:
-            list_out = [
-                {
-                    "actor_id": overview.get("actor_id"),
-                    "datasource_id": datasource,
-                    "name": data.get("name"),
-                    "publisher": data.get("publisher"),
-                    "published": data.get("published"),
-                    "URL": data.get("URL"),
-                }
-                for overview in overviews
-                if overview
-                for datasource, data in overview.get("emissions").items()
-            ]
+            list_out = self._datasets_records(overviews)
             if list_out:
-                return pd.DataFrame(list_out)
+                df = pd.DataFrame(list_out)
+                if normalize:
+                    return normalize_datasources(
+                        df.loc[:, ["actor_id", "datasource_id"]], datasources=self._datasources(df)
+                    )
+                return df
             return None
 
     def emissions(
@@ -80,32 +136,54 @@ class Emissions(Base):
         actor_id: Union[str, List[str], Tuple[str]],
         datasource_id: Optional[str] = None,
         ignore_warnings: bool = False,
+        normalize: bool = False,
+        backend: str = "pandas",
+        availability: Optional[AvailabilityIndex] = None,
         *args,
         **kwargs,
-    ) -> pd.DataFrame:
+    ) -> Union[pd.DataFrame, Tuple[pd.DataFrame, pd.DataFrame], Any]:
         """retrieve actor emissions
 
         Args:
             actor_id (Union[str, List[str], Tuple[str]], optional): actor code
             datasource_id (str, optional): emissions datasource. Defaults to None.
             ignore_warnings (bool, optional): ignore warnings messages
+            normalize (bool, optional): return a fact table with a datasource_key and a datasource table
+            backend (str, optional): result type, one of 'pandas', 'arrow' (pyarrow.Table) or 'polars' (polars.DataFrame)
+            availability (AvailabilityIndex, optional): skip actors known to have no data and record fetched ones
 
         Returns:
-            pd.DataFrame: _description_
+            pd.DataFrame: or a tuple of the fact and datasource tables if normalize is True
         """
+        check_backend(backend)
+        if normalize and backend != "pandas":
+            raise ValueError("normalize is only available with the pandas backend")
         try:
             actor_id = [actor_id] if isinstance(actor_id, str) else actor_id
-            overviews = ActorOverview().overview(
-                actor_id=actor_id, ignore_warnings=ignore_warnings
-            )
+            overviews = fetch_overviews(actor_id, "emissions", availability, ignore_warnings=ignore_warnings)
         except Exception:
             print(f"Something went wrong, check that {actor_id} is an actor")
         else:
+            if not any(overviews):
+                # none of the actors exist
+                return None
+            overviews = filter_overviews(overviews, 'emissions', ignore_warnings)
+            if backend != "pandas":
+                records = [
+                    record
+                    for overview in overviews
+                    if overview
+                    for record in self._records_emissions(overview, datasource_id=datasource_id)
+                ]
+                return records_to_frame(records, self.columns, backend=backend)
             df_list = [
                 self._get_emissions(overview) for overview in overviews if overview
             ]
-            df = pd.concat(df_list)
+            df = pd.concat(df_list) if df_list else pd.DataFrame(columns=self.columns)
             if datasource_id:
-                return df.loc[df["datasource_id"] == datasource_id]
-            else:
-                return df
+                df = df.loc[df["datasource_id"] == datasource_id]
+            if normalize:
+                df_datasources = self._datasources(pd.DataFrame(self._datasets_records(overviews)))
+                df_datasources = df_datasources.loc[df_datasources["datasource_id"].isin(df["datasource_id"])]
+                return normalize_datasources(df, datasources=df_datasources)
+            return df
@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+import pandas as pd
+from typing import List, Union, Tuple
+
+from .ActorOverview import ActorOverview
+from .Base import Base
+from .metrics import VALUE_COLUMNS, DatasourcePreference, metric_frame, select_datasource
+
+
+@dataclass
+class Panel(Base):
+    """Panel API class
+    align emissions, GDP and population on actor_id and year
+
+    Returns:
+        object
+    """
+
+    value_columns = VALUE_COLUMNS
+
+    def _year_over_year(self, df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """add relative year-over-year change columns
+
+        The change is only computed when the previous row of an actor is the
+        previous calendar year, gaps in the record give NaN.
+
+        Args:
+            df (pd.DataFrame): dataframe sorted by actor_id and year
+            columns (List[str]): columns to compute the change for
+
+        Returns:
+            pd.DataFrame
+        """
+        previous = df.groupby("actor_id", sort=False)[["year"] + columns].shift(1)
+        consecutive = (df["year"] - previous["year"]) == 1
+        for column in columns:
+            current = df[column].astype(float)
+            before = previous[column].astype(float)
+            change = (current - before) / before.where(before != 0)
+            df[f"{column}_yoy"] = change.where(consecutive)
+        return df
+
+    def panel(
+        self,
+        actor_id: Union[str, List[str], Tuple[str]],
+        emissions_datasource_id: DatasourcePreference = None,
+        gdp_datasource_id: DatasourcePreference = None,
+        population_datasource_id: DatasourcePreference = None,
+        wide: bool = False,
+        ignore_warnings: bool = False,
+        *args,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """retrieve an aligned actor x year panel of emissions, GDP and population
+
+        Each actor overview is fetched once. When an actor has several datasources
+        for a metric, the `*_datasource_id` arguments choose which one is used:
+        pass a single datasource_id or a list in order of preference. Actors
+        without any of the preferred datasources (or when no preference is given)
+        use the datasource with the most years of data.
+
+        Derived columns:
+            emissions_per_capita: total_emissions / population
+            emissions_intensity: total_emissions / gdp
+            <metric>_yoy: relative change from the previous year
+
+        Args:
+            actor_id (Union[str, List[str], Tuple[str]]): actor code
+            emissions_datasource_id (str|List[str], optional): emissions datasource preference
+            gdp_datasource_id (str|List[str], optional): GDP datasource preference
+            population_datasource_id (str|List[str], optional): population datasource preference
+            wide (bool, optional): return year rows with (variable, actor_id) columns. Defaults to False.
+            ignore_warnings (bool, optional): ignore warnings messages
+
+        Returns:
+            pd.DataFrame: one row per actor_id and year
+        """
+        actor_id = [actor_id] if isinstance(actor_id, str) else actor_id
+        overviews = ActorOverview().overview(actor_id=actor_id, ignore_warnings=ignore_warnings)
+        preferences = {
+            "emissions": emissions_datasource_id,
+            "gdp": gdp_datasource_id,
+            "population": population_datasource_id,
+        }
+
+        frames = [
+            select_datasource(metric_frame(overviews, metric), value_column, preferences[metric]).rename(
+                columns={"datasource_id": f"{metric}_datasource_id"}
+            )
+            for metric, value_column in self.value_columns.items()
+        ]
+        df = frames[0]
+        for df_metric in frames[1:]:
+            df = df.merge(df_metric, on=["actor_id", "year"], how="outer")
+
+        df = df.sort_values(by=["actor_id", "year"]).reset_index(drop=True)
+        values = list(self.value_columns.values())
+        df[values] = df[values].astype(float)
+
+        population = df["population"].where(df["population"] > 0)
+        gdp = df["gdp"].where(df["gdp"] > 0)
+        df["emissions_per_capita"] = df["total_emissions"] / population
+        df["emissions_intensity"] = df["total_emissions"] / gdp
+        df = self._year_over_year(df, values + ["emissions_per_capita", "emissions_intensity"])
+
+        if wide:
+            return pd.DataFrame(df.set_index(["actor_id", "year"]).unstack("actor_id"))
+        return df
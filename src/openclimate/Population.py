@@ -1,16 +1,28 @@
 from dataclasses import dataclass
 import pandas as pd
-from typing import List, Dict, Union, Tuple, Any
+from typing import List, Dict, Union, Tuple, Any, Optional
 
 from .utils import explode_dict_columns
 from .utils import filter_overviews
+from .utils import normalize_datasources
+from .utils import check_backend, flatten_record, records_to_frame
 
-from .ActorOverview import ActorOverview
+from .Availability import AvailabilityIndex, fetch_overviews
 from .Base import Base
 
 
 @dataclass
 class Population(Base):
+    columns = [
+        "actor_id",
+        "year",
+        "population",
+        "datasource_id",
+        "datasource_name",
+        "datasource_published",
+        "datasource_URL",
+    ]
+
     def _get_population(self, overview: Dict[Any, Any]) -> pd.DataFrame:
         """retreive population from overview dictionary
 
@@ -23,37 +35,62 @@ class Population(Base):
         data = overview["population"]
         df = pd.DataFrame(data).sort_values(by=["year"])
         df["actor_id"] = overview["actor_id"]
-        columns = [
-            "actor_id",
-            "year",
-            "population",
-            "datasource_id",
-            "datasource_name",
-            "datasource_published",
-            "datasource_URL",
-        ]
-        return explode_dict_columns(df).loc[:, columns].reset_index(drop=True)
+        return explode_dict_columns(df).loc[:, self.columns].reset_index(drop=True)
+
+    def _records_population(self, overview: Dict[Any, Any]) -> List[Dict[str, Any]]:
+        """retreive flat population records from overview dictionary
+
+        Args:
+            overview (Dict): dictionary of overview
+
+        Returns:
+            List[Dict]: records sorted by year
+        """
+        records = [flatten_record(dict(row, actor_id=overview["actor_id"])) for row in overview["population"]]
+        return sorted(records, key=lambda record: record["year"])
 
     def population(
-        self, actor_id: Union[str, List[str], Tuple[str]], ignore_warnings: bool = False, *args, **kwargs
-    ) -> pd.DataFrame:
+        self,
+        actor_id: Union[str, List[str], Tuple[str]],
+        ignore_warnings: bool = False,
+        normalize: bool = False,
+        backend: str = "pandas",
+        availability: Optional[AvailabilityIndex] = None,
+        *args,
+        **kwargs,
+    ) -> Union[pd.DataFrame, Tuple[pd.DataFrame, pd.DataFrame], Any]:
         """retreive actor population
 
         Args:
             actor_id (Union[str, List[str], Tuple[str]], optional): actor code
             ignore_warnings (bool): ignore warning messages
+            normalize (bool): return a fact table with a datasource_key and a datasource table
+            backend (str): result type, one of 'pandas', 'arrow' (pyarrow.Table) or 'polars' (polars.DataFrame)
+            availability (AvailabilityIndex): skip actors known to have no data and record the fetched ones
 
         Returns:
-            pd.DataFrame:
+            pd.DataFrame: or a tuple of the fact and datasource tables if normalize is True
         """
+        check_backend(backend)
+        if normalize and backend != "pandas":
+            raise ValueError("normalize is only available with the pandas backend")
         try:
             actor_id = [actor_id] if isinstance(actor_id, str) else actor_id
-            overviews = ActorOverview().overview(actor_id=actor_id, ignore_warnings=ignore_warnings)
+            overviews = fetch_overviews(actor_id, "population", availability, ignore_warnings=ignore_warnings)
         except Exception:
             print(f"Something went wrong, check that {actor_id} is an actor")
         else:
+            if not any(overviews):
+                # none of the actors exist
+                return None
             overviews = filter_overviews(overviews, 'population', ignore_warnings)
+            if backend != "pandas":
+                records = [record for overview in overviews for record in self._records_population(overview)]
+                return records_to_frame(records, self.columns, backend=backend)
             df_list = [
                 self._get_population(overview) for overview in overviews if overview
             ]
-            return pd.concat(df_list)
+            df = pd.concat(df_list) if df_list else pd.DataFrame(columns=self.columns)
+            if normalize:
+                return normalize_datasources(df)
+            return df
@@ -0,0 +1,175 @@
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+from typing import List, Union, Tuple, Optional
+
+from .ActorOverview import ActorOverview
+from .Base import Base
+from .Targets import Targets
+from .metrics import metric_frame, select_datasource
+
+
+@dataclass
+class Progress(Base):
+    """Progress API class
+    compare actor targets with reported emissions
+
+    Returns:
+        object
+    """
+
+    percent_units = ("percent", "%")
+    absolute_types = ("absolute emission reduction",)
+
+    def _trend(self, emissions: pd.DataFrame, trend_years: int = 5) -> pd.DataFrame:
+        """latest emissions and least-squares linear trend for each actor
+
+        The trend is fit over the last `trend_years` years of data of each actor,
+        with years relative to the latest year so the intercept is the fitted
+        latest emissions.
+
+        Args:
+            emissions (pd.DataFrame): actor_id, year and total_emissions columns
+            trend_years (int): number of years used to fit the trend
+
+        Returns:
+            pd.DataFrame: latest_year, latest_emissions, trend_slope and trend_intercept indexed by actor_id
+        """
+        df = emissions.dropna(subset=["total_emissions"]).loc[:, ["actor_id", "year", "total_emissions"]]
+        df = df.astype({"year": float, "total_emissions": float})
+        latest_year = df.groupby("actor_id")["year"].transform("max")
+        df = df.loc[df["year"] > latest_year - trend_years].assign(x=lambda d: d["year"] - latest_year)
+        df = df.assign(xy=df["x"] * df["total_emissions"], xx=df["x"] ** 2)
+
+        sums = df.groupby("actor_id").agg(
+            n=("x", "size"),
+            sx=("x", "sum"),
+            sy=("total_emissions", "sum"),
+            sxy=("xy", "sum"),
+            sxx=("xx", "sum"),
+            latest_year=("year", "max"),
+        )
+        latest = df.loc[df["x"] == 0].groupby("actor_id")["total_emissions"].last()
+
+        denominator = sums["n"] * sums["sxx"] - sums["sx"] ** 2
+        slope = (sums["n"] * sums["sxy"] - sums["sx"] * sums["sy"]) / denominator.where(denominator != 0)
+        slope = slope.fillna(0.0)
+        intercept = (sums["sy"] - slope * sums["sx"]) / sums["n"]
+
+        return pd.DataFrame(
+            {
+                "latest_year": sums["latest_year"],
+                "latest_emissions": latest.reindex(sums.index),
+                "trend_slope": slope,
+                "trend_intercept": intercept,
+            }
+        )
+
+    def _evaluate(self, targets: pd.DataFrame, emissions: pd.DataFrame, trend_years: int = 5) -> pd.DataFrame:
+        """evaluate all actor/target pairs in one vectorized pass
+
+        Only absolute emission reduction targets expressed as a percent of a
+        baseline year can be converted to a target emissions level, other targets
+        (e.g. intensity or per capita targets) are returned with NaN progress columns. Targets whose year is not after the latest
+        reported year are evaluated on the emissions reported in the target year.
+
+        Args:
+            targets (pd.DataFrame): output of `Targets.targets`
+            emissions (pd.DataFrame): emissions with a single datasource per actor
+            trend_years (int): number of years used to fit the emissions trend
+
+        Returns:
+            pd.DataFrame: targets with progress columns
+        """
+        df = targets.reset_index(drop=True)
+        baseline_year = pd.to_numeric(df["baseline_year"], errors="coerce")
+        target_year = pd.to_numeric(df["target_year"], errors="coerce")
+        target_value = pd.to_numeric(df["target_value"], errors="coerce")
+
+        reported = (
+            emissions.loc[:, ["actor_id", "year", "total_emissions"]]
+            .dropna()
+            .astype({"year": float, "total_emissions": float})
+            .drop_duplicates(subset=["actor_id", "year"])
+            .set_index(["actor_id", "year"])["total_emissions"]
+        )
+        keys = pd.MultiIndex.from_arrays([df["actor_id"], baseline_year.astype(float)])
+        baseline_emissions = pd.Series(reported.reindex(keys).to_numpy(), index=df.index)
+        keys = pd.MultiIndex.from_arrays([df["actor_id"], target_year.astype(float)])
+        target_year_emissions = pd.Series(reported.reindex(keys).to_numpy(), index=df.index)
+
+        trend = self._trend(emissions, trend_years=trend_years).reindex(df["actor_id"])
+        trend.index = df.index
+
+        is_absolute = df["target_type"].astype(str).str.lower().isin(self.absolute_types)
+        is_reduction = df["target_unit"].astype(str).str.lower().isin(self.percent_units) & is_absolute
+        target_emissions = (baseline_emissions * (1 - target_value / 100)).where(is_reduction)
+        years_remaining = target_year - trend["latest_year"]
+        latest_emissions = trend["latest_emissions"]
+
+        required_annual_rate = 1 - np.power(
+            target_emissions / latest_emissions.where(latest_emissions > 0),
+            1 / years_remaining.where(years_remaining > 0),
+        )
+        # past target years are not extrapolated backwards
+        is_past = years_remaining <= 0
+        projected_emissions = (trend["trend_intercept"] + trend["trend_slope"] * years_remaining).clip(lower=0)
+        projected_emissions = projected_emissions.where(~is_past, target_year_emissions)
+        on_track = (projected_emissions <= target_emissions).astype("boolean")
+        on_track = on_track.mask(projected_emissions.isna() | target_emissions.isna())
+
+        return df.assign(
+            baseline_emissions=baseline_emissions,
+            target_emissions=target_emissions,
+            latest_year=trend["latest_year"],
+            latest_emissions=latest_emissions,
+            reduction_to_date=1 - latest_emissions / baseline_emissions.where(baseline_emissions > 0),
+            target_reduction=(target_value / 100).where(is_reduction),
+            years_remaining=years_remaining.clip(lower=0),
+            required_annual_rate=required_annual_rate,
+            projected_emissions=projected_emissions,
+            on_track=on_track,
+        )
+
+    def progress(
+        self,
+        actor_id: Union[str, List[str], Tuple[str]],
+        datasource_id: Optional[Union[str, List[str], Tuple[str]]] = None,
+        trend_years: int = 5,
+        ignore_warnings: bool = False,
+        *args,
+        **kwargs,
+    ) -> Optional[pd.DataFrame]:
+        """retrieve progress of actors towards their targets
+
+        Columns added to the targets:
+            baseline_emissions: emissions in the baseline year
+            target_emissions: emissions level implied by the target
+            latest_year, latest_emissions: most recent reported emissions
+            reduction_to_date: reduction of latest emissions relative to baseline
+            target_reduction: reduction relative to baseline required by the target
+            years_remaining: years from the latest year to the target year, 0 when it has passed
+            required_annual_rate: compound annual reduction needed from the latest year
+            projected_emissions: linear extrapolation of recent emissions to the target year,
+                or emissions reported in the target year when it has passed
+            on_track: projected emissions meet the target
+
+        Args:
+            actor_id (Union[str, List[str], Tuple[str]]): actor code
+            datasource_id (str|List[str], optional): emissions datasource, or list in order of preference
+            trend_years (int, optional): number of recent years used for the extrapolation. Defaults to 5.
+            ignore_warnings (bool, optional): ignore warnings messages
+
+        Returns:
+            pd.DataFrame: one row per actor and target
+        """
+        actor_id = [actor_id] if isinstance(actor_id, str) else actor_id
+        overviews = ActorOverview().overview(actor_id=actor_id, ignore_warnings=ignore_warnings)
+
+        df_list = [Targets()._get_target(overview) for overview in overviews if overview and overview.get("targets")]
+        if not df_list:
+            return None
+        targets = pd.concat(df_list, ignore_index=True)
+
+        emissions = select_datasource(metric_frame(overviews, "emissions"), "total_emissions", datasource_id)
+        return self._evaluate(targets, emissions, trend_years=trend_years)
@@ -0,0 +1,171 @@
+from dataclasses import dataclass, field
+import pandas as pd
+from typing import List, Dict, Optional
+
+from .ActorOverview import ActorOverview
+from .Base import Base
+from .metrics import VALUE_COLUMNS, metric_frame
+
+
+@dataclass
+class RollupResult:
+    """result of a roll-up of an actor's parts
+
+    Attributes:
+        totals (pd.DataFrame): parent value and sum of parts for each part type, year and datasource
+        coverage (pd.DataFrame): data availability of each part, and the error of parts that failed
+    """
+
+    totals: pd.DataFrame = field(default_factory=pd.DataFrame)
+    coverage: pd.DataFrame = field(default_factory=pd.DataFrame)
+
+    @property
+    def missing(self) -> List[str]:
+        """actor_ids of parts without data, including failed parts"""
+        if self.coverage.empty:
+            return []
+        return self.coverage.loc[~self.coverage["has_data"], "actor_id"].tolist()
+
+    @property
+    def failed(self) -> List[str]:
+        """actor_ids of parts whose request failed"""
+        if self.coverage.empty:
+            return []
+        return self.coverage.loc[self.coverage["error"].notna(), "actor_id"].tolist()
+
+
+@dataclass
+class Rollup(Base):
+    """Rollup API class
+    aggregate metrics of an actor's parts and compare them with the actor
+
+    Returns:
+        object
+    """
+
+    def _aggregate(
+        self, parent: pd.DataFrame, children: pd.DataFrame, value_column: str, n_parts: Dict[str, int]
+    ) -> pd.DataFrame:
+        """sum children per part type, year and datasource and compare with the parent
+
+        Parts of different administrative levels (e.g. adm1 and city) overlap, so
+        they are summed separately and each level is compared with the parent.
+
+        Args:
+            parent (pd.DataFrame): long metric dataframe of the parent actor
+            children (pd.DataFrame): long metric dataframe of the parts with a part_type column
+            value_column (str): name of the value column
+            n_parts (Dict[str, int]): number of parts of the parent per part type
+
+        Returns:
+            pd.DataFrame
+        """
+        keys = ["part_type", "year", "datasource_id"]
+        parts_total = (
+            children.dropna(subset=[value_column])
+            .astype({value_column: float})
+            .groupby(keys, as_index=False)
+            .agg(parts_total=(value_column, "sum"), n_parts_reporting=("actor_id", "nunique"))
+        )
+        parent_total = (
+            parent.loc[:, ["year", "datasource_id", value_column]]
+            .astype({value_column: float})
+            .rename(columns={value_column: "parent_total"})
+            .merge(pd.DataFrame({"part_type": list(n_parts)}), how="cross")
+        )
+        df = parent_total.merge(parts_total, on=keys, how="outer").sort_values(by=keys)
+        df["n_parts_reporting"] = df["n_parts_reporting"].fillna(0).astype(int)
+        df["n_parts"] = df["part_type"].map(n_parts).fillna(0).astype(int)
+        df["coverage"] = df["n_parts_reporting"] / df["n_parts"].where(df["n_parts"] > 0)
+        df["difference"] = df["parent_total"] - df["parts_total"]
+        df["ratio"] = df["parts_total"] / df["parent_total"].where(df["parent_total"] != 0)
+        return df.reset_index(drop=True)
+
+    def _coverage(self, parts: pd.DataFrame, children: pd.DataFrame, errors: Dict[str, str]) -> pd.DataFrame:
+        """data availability of each part
+
+        Args:
+            parts (pd.DataFrame): output of `ActorOverview.parts`
+            children (pd.DataFrame): long metric dataframe of the parts
+            errors (Dict[str, str]): error of each part whose request failed
+
+        Returns:
+            pd.DataFrame: one row per part
+        """
+        available = children.groupby("actor_id").agg(
+            first_year=("year", "min"),
+            last_year=("year", "max"),
+            n_years=("year", "nunique"),
+            datasources=("datasource_id", lambda x: sorted(set(x))),
+        )
+        df = parts.loc[:, ["actor_id", "name", "type"]].merge(
+            available, left_on="actor_id", right_index=True, how="left"
+        )
+        df["has_data"] = df["n_years"].notna()
+        df["n_years"] = df["n_years"].fillna(0).astype(int)
+        df["error"] = [errors.get(actor) for actor in df["actor_id"]]
+        return df.reset_index(drop=True)
+
+    def rollup(
+        self,
+        actor_id: str,
+        metric: str = "emissions",
+        part_type: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        ignore_warnings: bool = False,
+        *args,
+        **kwargs,
+    ) -> Optional[RollupResult]:
+        """sum the parts of an actor and compare with the actor's own values
+
+        The actor and all its parts are fetched concurrently. Values are summed
+        per part type, year and datasource, so parts of different administrative
+        levels are never added together and only parts reported by the same
+        datasource as the parent are compared.
+
+        Args:
+            actor_id (str): code of the parent actor
+            metric (str, optional): one of 'emissions', 'gdp' or 'population'. Defaults to 'emissions'.
+            part_type (str, optional): only include parts of this administrative level
+            concurrency (int, optional): maximum number of simultaneous requests
+            ignore_warnings (bool, optional): ignore warnings messages
+
+        Raises:
+            Exception: the request of the parent actor failed
+
+        Returns:
+            RollupResult: totals per part type, year and datasource, and coverage of each part
+        """
+        if metric not in VALUE_COLUMNS:
+            raise ValueError(f"MetricError: {metric} not in {list(VALUE_COLUMNS)}")
+        value_column = VALUE_COLUMNS[metric]
+
+        parts = ActorOverview().parts(actor_id=actor_id, part_type=part_type)
+        if parts is None:
+            return None
+
+        part_ids = parts["actor_id"].tolist()
+        overviews = ActorOverview().overview(
+            actor_id=[actor_id] + part_ids,
+            ignore_warnings=ignore_warnings,
+            concurrency=concurrency,
+            return_exceptions=True,
+        )
+        if isinstance(overviews[0], BaseException):
+            raise overviews[0]
+        # failed parts are left out of the totals and reported in the coverage
+        errors = {
+            actor: f"{type(overview).__name__}: {overview}"
+            for actor, overview in zip(part_ids, overviews[1:])
+            if isinstance(overview, BaseException)
+        }
+        parent = metric_frame(overviews[:1], metric)
+        children = metric_frame([overview for overview in overviews[1:] if isinstance(overview, dict)], metric)
+        part_types = parts["type"].fillna("unknown")
+        children["part_type"] = children["actor_id"].map(dict(zip(parts["actor_id"], part_types)))
+        n_parts = {str(key): int(count) for key, count in part_types.value_counts().items()}
+
+        return RollupResult(
+            totals=self._aggregate(parent, children, value_column, n_parts=n_parts),
+            coverage=self._coverage(parts, children, errors=errors),
+        )
@@ -1,13 +1,36 @@
 from dataclasses import dataclass
 import pandas as pd
-import requests
-from typing import Optional
+from typing import Dict, Any, Iterator, Optional, Union
 
 from .Base import Base
+from .Transfer import get_json, iter_content
+from .utils import check_backend, iter_json_array, iter_pages, records_to_frame
 
 
 @dataclass
 class Search(Base):
+    """Search API class
+    search actor names and identifiers
+
+    Args:
+        compression (bool): request compressed responses. Defaults to True.
+
+    Returns:
+        object
+    """
+
+    compression: bool = True
+    columns = [
+        "actor_id",
+        "name",
+        "type",
+        "is_part_of",
+        "datasource_id",
+        "root_path_geo",
+        "names",
+        "identifiers",
+    ]
+
     def _search_endpoint(
         self,
         name: Optional[str] = None,
@@ -55,9 +78,10 @@ class Search(Base):
         query: Optional[str] = None,
         language: Optional[str] = None,
         namespace: Optional[str] = None,
+        backend: str = "pandas",
         *args,
         **kwargs,
-    ) -> pd.DataFrame:
+    ) -> Union[pd.DataFrame, Any]:
         """search actors
 
         Args:
@@ -66,10 +90,54 @@ class Search(Base):
             language (str, optional): two letter language code [requires name to be set]
             identifier (str): searches for actors with exact identifier code match (e.g. "US")
             namespace (str, optional): actor namespace code [requires identifier to be be set]
+            backend (str, optional): result type, one of 'pandas', 'arrow' (pyarrow.Table) or 'polars' (polars.DataFrame)
 
         Returns:
             pd.DataFrame: dataframe with search results
         """
+        check_backend(backend)
+        endpoint = self._search_endpoint(
+            name=name,
+            query=query,
+            identifier=identifier,
+            language=language,
+            namespace=namespace,
+        )
+        url = f"{self.server}{endpoint}"
+        data_list = get_json(url, endpoint="/search/actor", compression=self.compression)["data"]
+        if backend != "pandas":
+            return records_to_frame(data_list, self.columns, backend=backend)
+        return pd.DataFrame(data_list).loc[:, self.columns]
+
+    def iter_search(
+        self,
+        name: Optional[str] = None,
+        identifier: Optional[str] = None,
+        query: Optional[str] = None,
+        language: Optional[str] = None,
+        namespace: Optional[str] = None,
+        page_size: Optional[int] = None,
+        chunk_size: int = 65536,
+        *args,
+        **kwargs,
+    ) -> Iterator[Union[Dict[str, Any], pd.DataFrame]]:
+        """stream search results
+
+        The response is parsed incrementally as it is read from the socket, so
+        memory stays bounded by `page_size` regardless of the number of results.
+
+        Args:
+            query (str): full search of identifiers and names that include the search parameter
+            name (str): searches for actors with exact name match (e.g. "Minnesota")
+            language (str, optional): two letter language code [requires name to be set]
+            identifier (str): searches for actors with exact identifier code match (e.g. "US")
+            namespace (str, optional): actor namespace code [requires identifier to be be set]
+            page_size (int, optional): yield DataFrames of `page_size` rows instead of records
+            chunk_size (int, optional): bytes read from the socket at a time. Defaults to 65536.
+
+        Yields:
+            Dict|DataFrame: one record per actor, or a DataFrame per page
+        """
         endpoint = self._search_endpoint(
             name=name,
             query=query,
@@ -78,17 +146,9 @@ class Search(Base):
             namespace=namespace,
         )
         url = f"{self.server}{endpoint}"
-        headers = {"Accept": "application/json"}
-        response = requests.get(url, headers=headers)
-        data_list = response.json()["data"]
-        columns = [
-            "actor_id",
-            "name",
-            "type",
-            "is_part_of",
-            "datasource_id",
-            "root_path_geo",
-            "names",
-            "identifiers",
-        ]
-        return pd.DataFrame(data_list).loc[:, columns]
+        chunks = iter_content(url, endpoint="/search/actor", compression=self.compression, chunk_size=chunk_size)
+        records = iter_json_array(chunks, key="data")
+        if page_size:
+            yield from iter_pages(records, page_size, columns=self.columns)
+        else:
+            yield from records
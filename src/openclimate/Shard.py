@@ -0,0 +1,230 @@
+from dataclasses import dataclass, field, asdict
+from functools import cached_property
+import hashlib
+import json
+import os
+import pandas as pd
+from typing import List, Union, Tuple, Optional
+
+from .Base import Base
+from .Batch import BatchJob, BatchResult
+
+
+def shard_of(actor_id: str, n_shards: int) -> int:
+    """deterministic shard of an actor
+
+    uses a hash of the actor_id that is stable across processes and machines
+    (unlike the builtin `hash`)
+
+    Args:
+        actor_id (str): actor code
+        n_shards (int): number of shards
+
+    Returns:
+        int: shard index in [0, n_shards)
+    """
+    digest = hashlib.sha1(actor_id.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % n_shards
+
+
+@dataclass
+class ShardManifest:
+    """actor list of a sharded job and its split into shards
+
+    Attributes:
+        metric (str): one of 'emissions', 'targets', 'gdp' or 'population'
+        n_shards (int): number of shards
+        actor_ids (List[str]): unique actor codes
+    """
+
+    metric: str
+    n_shards: int
+    actor_ids: List[str] = field(default_factory=list)
+
+    @property
+    def digest(self) -> str:
+        """fingerprint of the manifest, written with every shard"""
+        content = json.dumps([self.metric, self.n_shards, self.actor_ids]).encode("utf-8")
+        return hashlib.sha1(content).hexdigest()
+
+    @cached_property
+    def shards(self) -> List[List[str]]:
+        """actors of every shard, hashing each actor once"""
+        shards: List[List[str]] = [[] for _ in range(self.n_shards)]
+        for actor in self.actor_ids:
+            shards[shard_of(actor, self.n_shards)].append(actor)
+        return shards
+
+    def shard(self, index: int) -> List[str]:
+        """actors of a shard
+
+        Args:
+            index (int): shard index
+
+        Returns:
+            List[str]: actor codes in manifest order
+        """
+        if not 0 <= index < self.n_shards:
+            raise ValueError(f"ShardError: shard {index} not in [0, {self.n_shards})")
+        return list(self.shards[index])
+
+    def save(self, path: str) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(dict(asdict(self), digest=self.digest), f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "ShardManifest":
+        with open(path) as f:
+            content = json.load(f)
+        manifest = cls(metric=content["metric"], n_shards=content["n_shards"], actor_ids=content["actor_ids"])
+        if content.get("digest") != manifest.digest:
+            raise ValueError(f"ShardError: {path} is corrupted")
+        return manifest
+
+
+@dataclass
+class ShardedJob(Base):
+    """ShardedJob API class
+    split a batch job into deterministic shards that run on different nodes
+
+    The nodes only share the `root` directory (e.g. a network file system, or
+    shard directories copied back before merging):
+
+        root/manifest.json      actor list and number of shards
+        root/shard-00000/       batch checkpoint of shard 0
+        root/shard-00001/       ...
+
+    Each shard is a resumable `BatchJob` checkpoint, so a shard can be run again
+    on any node until all its actors are finished.
+
+    Args:
+        root (str): directory of the manifest and shard checkpoints
+        concurrency (int, optional): maximum number of simultaneous requests per node
+        chunk_size (int): number of actors fetched between checkpoints
+
+    Returns:
+        object
+    """
+
+    root: str = "openclimate-shards"
+    concurrency: Optional[int] = None
+    chunk_size: int = 100
+
+    @property
+    def _manifest_path(self) -> str:
+        return os.path.join(self.root, "manifest.json")
+
+    def _shard_dir(self, index: int) -> str:
+        return os.path.join(self.root, f"shard-{index:05d}")
+
+    def _batch(self, manifest: ShardManifest, index: int) -> BatchJob:
+        return BatchJob(
+            metric=manifest.metric,
+            checkpoint_dir=self._shard_dir(index),
+            chunk_size=self.chunk_size,
+            concurrency=self.concurrency,
+        )
+
+    def manifest(self) -> ShardManifest:
+        return ShardManifest.load(self._manifest_path)
+
+    def plan(
+        self, actor_id: Union[str, List[str], Tuple[str]], n_shards: int, metric: str = "emissions"
+    ) -> ShardManifest:
+        """write the manifest of a sharded job
+
+        Args:
+            actor_id (Union[str, List[str], Tuple[str]]): actor code
+            n_shards (int): number of shards
+            metric (str, optional): one of 'emissions', 'targets', 'gdp' or 'population'. Defaults to 'emissions'.
+
+        Returns:
+            ShardManifest
+        """
+        if n_shards < 1:
+            raise ValueError(f"ShardError: n_shards must be positive, got {n_shards}")
+        BatchJob(metric=metric)
+        actor_list = [actor_id] if isinstance(actor_id, str) else actor_id
+        manifest = ShardManifest(metric=metric, n_shards=n_shards, actor_ids=list(dict.fromkeys(actor_list)))
+        if os.path.exists(self._manifest_path) and self.manifest().digest != manifest.digest:
+            raise ValueError(f"ShardError: {self._manifest_path} exists with a different plan")
+        os.makedirs(self.root, exist_ok=True)
+        manifest.save(self._manifest_path)
+        return manifest
+
+    def run(self, index: int) -> BatchResult:
+        """run one shard, resuming from its checkpoint
+
+        Args:
+            index (int): shard index
+
+        Returns:
+            BatchResult: data and status of the shard
+        """
+        manifest = self.manifest()
+        actors = manifest.shard(index)
+        batch = self._batch(manifest, index)
+        os.makedirs(batch.checkpoint_dir, exist_ok=True)
+        with open(os.path.join(batch.checkpoint_dir, "shard.json"), "w") as f:
+            json.dump({"index": index, "digest": manifest.digest}, f)
+        return batch.run(actor_id=actors)
+
+    def progress(self) -> pd.DataFrame:
+        """status counts of every shard, read from the filesystem
+
+        Returns:
+            pd.DataFrame: one row per shard with the number of actors per status and pending actors
+        """
+        manifest = self.manifest()
+        rows = []
+        for index in range(manifest.n_shards):
+            actors = manifest.shard(index)
+            status = self._batch(manifest, index).status()
+            status = status.loc[status["actor_id"].isin(actors)]
+            counts = {str(key): int(count) for key, count in status["status"].value_counts().items()}
+            done = int(status["status"].isin(BatchJob.final_statuses).sum())
+            rows.append(dict(shard=index, actors=len(actors), pending=len(actors) - done, **counts))
+        return pd.DataFrame(rows).fillna(0)
+
+    def merge(self, allow_incomplete: bool = False) -> BatchResult:
+        """validate that all shards are complete and concatenate their data
+
+        Args:
+            allow_incomplete (bool, optional): merge even if some actors are pending or failed. Defaults to False.
+
+        Raises:
+            RuntimeError: a shard was run for a different manifest, or actors are unfinished
+
+        Returns:
+            BatchResult: data of every finished actor and status of every actor, with a shard column
+        """
+        manifest = self.manifest()
+        data_list, status_list = [], []
+        for index in range(manifest.n_shards):
+            batch = self._batch(manifest, index)
+            marker = os.path.join(batch.checkpoint_dir, "shard.json")
+            if os.path.exists(marker):
+                with open(marker) as f:
+                    if json.load(f).get("digest") != manifest.digest:
+                        raise RuntimeError(f"ShardError: shard {index} was run for a different manifest")
+            result = batch.result()
+            status = (
+                pd.DataFrame({"actor_id": pd.Series(manifest.shard(index), dtype=object)})
+                .merge(result.status, on="actor_id", how="left")
+                .assign(shard=index)
+            )
+            status["status"] = status["status"].fillna("pending")
+            status_list.append(status)
+            if not result.data.empty:
+                data_list.append(result.data)
+
+        status = pd.concat(status_list, ignore_index=True)
+        unfinished = status.loc[~status["status"].isin(BatchJob.final_statuses)]
+        if len(unfinished) and not allow_incomplete:
+            counts = unfinished.groupby("shard")["actor_id"].count().to_dict()
+            raise RuntimeError(f"ShardError: {len(unfinished)} actors are pending or failed (per shard: {counts})")
+
+        data = pd.concat(data_list, ignore_index=True) if data_list else pd.DataFrame()
+        return BatchResult(data=data, status=status)
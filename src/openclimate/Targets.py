@@ -1,16 +1,38 @@
 from dataclasses import dataclass
 import pandas as pd
-from typing import List, Dict, Union, Tuple, Any
+from typing import List, Dict, Union, Tuple, Any, Optional
 
 from .utils import explode_dict_columns
 from .utils import filter_overviews
+from .utils import normalize_datasources
+from .utils import check_backend, flatten_record, records_to_frame
 
-from .ActorOverview import ActorOverview
+from .Availability import AvailabilityIndex, fetch_overviews
 from .Base import Base
 
 
 @dataclass
 class Targets(Base):
+    columns = [
+        "actor_id",
+        "target_type",
+        "baseline_year",
+        "baseline_value",
+        "target_year",
+        "target_value",
+        "target_unit",
+        "datasource_id",
+        "datasource_name",
+        "datasource_publisher",
+        "datasource_published",
+        "datasource_URL",
+        "initiative_initiative_id",
+        "initiative_name",
+        "initiative_description",
+        "initiative_URL",
+    ]
+    renames = {"initiative_initiative_id": "initiative_id"}
+
     def _get_target(self, overview: Dict[Any, Any]) -> pd.DataFrame:
         """retreive targets from overview dictionary
 
@@ -23,60 +45,81 @@ class Targets(Base):
         data = overview["targets"]
 
         if data:
-            columns_tmp = [
-                "actor_id",
-                "target_type",
-                "baseline_year",
-                "baseline_value",
-                "target_year",
-                "target_value",
-                "target_unit",
-                "datasource_id",
-                "datasource_name",
-                "datasource_publisher",
-                "datasource_published",
-                "datasource_URL",
-                "initiative_initiative_id",
-                "initiative_name",
-                "initiative_description",
-                "initiative_URL",
-            ]
-            df = (
+            df = explode_dict_columns(
                 pd.DataFrame(data)
                 .sort_values(by=["target_year"])
                 .assign(actor_id=overview["actor_id"])
+                .reset_index(drop=True)
             )
 
-            columns = [col for col in columns_tmp if col in df.columns]
+            columns = [col for col in self.columns if col in df.columns]
 
             return (
-                explode_dict_columns(df)
+                df
                 .loc[:, columns]
-                .rename({"initiative_initiative_id": "initiative_id"})
+                .rename(columns=self.renames)
                 .reset_index(drop=True)
             )
 
         return None
 
+    def _records_target(self, overview: Dict[Any, Any]) -> List[Dict[str, Any]]:
+        """retreive flat target records from overview dictionary
+
+        Args:
+            overview (Dict): dictionary of overview
+
+        Returns:
+            List[Dict]: records sorted by target_year
+        """
+        records = [flatten_record(dict(row, actor_id=overview["actor_id"])) for row in overview["targets"] or []]
+        records = sorted(records, key=lambda record: (record.get("target_year") is None, record.get("target_year")))
+        return [{self.renames.get(key, key): value for key, value in record.items()} for record in records]
+
     def targets(
-        self, actor_id: Union[str, List[str], Tuple[str]], ignore_warnings: bool = False, *args, **kwargs
-    ) -> pd.DataFrame:
+        self,
+        actor_id: Union[str, List[str], Tuple[str]],
+        ignore_warnings: bool = False,
+        normalize: bool = False,
+        backend: str = "pandas",
+        availability: Optional[AvailabilityIndex] = None,
+        *args,
+        **kwargs,
+    ) -> Union[pd.DataFrame, Tuple[pd.DataFrame, pd.DataFrame], Any]:
         """retreive actor targets
 
         Args:
             actor_id (Union[str, List[str], Tuple[str]], optional): actor code
             ignore_warnings (bool): ignore warning messages
+            normalize (bool): return a fact table with a datasource_key and a datasource table
+            backend (str): result type, one of 'pandas', 'arrow' (pyarrow.Table) or 'polars' (polars.DataFrame)
+            availability (AvailabilityIndex): skip actors known to have no data and record the fetched ones
 
         Returns:
-            pd.DataFrame:
+            pd.DataFrame: or a tuple of the fact and datasource tables if normalize is True
         """
+        check_backend(backend)
+        if normalize and backend != "pandas":
+            raise ValueError("normalize is only available with the pandas backend")
         try:
             actor_id = [actor_id] if isinstance(actor_id, str) else actor_id
-            overviews = ActorOverview().overview(actor_id=actor_id, ignore_warnings=ignore_warnings)
+            overviews = fetch_overviews(actor_id, "targets", availability, ignore_warnings=ignore_warnings)
         except Exception:
             print(f"Something went wrong, check that {actor_id} is an actor")
         else:
+            if not any(overviews):
+                # none of the actors exist
+                return None
             overviews = filter_overviews(overviews, 'targets', ignore_warnings)
             overviews = [overview for overview in overviews if 'targets' in overview.keys()]
+            if backend != "pandas":
+                records = [record for overview in overviews for record in self._records_target(overview)]
+                keys = {key for record in records for key in record}
+                columns = [self.renames.get(col, col) for col in self.columns]
+                return records_to_frame(records, [col for col in columns if col in keys], backend=backend)
             df_list = [self._get_target(overview) for overview in overviews if overview]
-            return pd.concat(df_list)
+            columns = [self.renames.get(col, col) for col in self.columns]
+            df = pd.concat(df_list) if df_list else pd.DataFrame(columns=columns)
+            if normalize:
+                return normalize_datasources(df)
+            return df
@@ -0,0 +1,117 @@
+from dataclasses import dataclass, field
+import json
+import threading
+import pandas as pd
+import requests
+from typing import Dict, Any, Iterator
+
+from urllib3.util.request import ACCEPT_ENCODING
+
+
+def accept_encoding(compression: bool = True) -> str:
+    """content codings the client can decode
+
+    gzip and deflate are always available, br and zstd when urllib3 can decode
+    them (`brotli` or `zstandard` installed). Responses are decompressed by
+    urllib3 as they are read.
+
+    Args:
+        compression (bool): request compressed responses. Defaults to True.
+
+    Returns:
+        str: value of the Accept-Encoding header
+    """
+    if not compression:
+        return "identity"
+    return ", ".join(ACCEPT_ENCODING.split(","))
+
+
+@dataclass
+class TransferStats:
+    """bytes transferred per endpoint
+
+    `wire_bytes` are read from the socket (compressed), `decoded_bytes` are the
+    decompressed body. Updates are thread-safe.
+    """
+
+    _stats: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def record(self, endpoint: str, wire_bytes: int, decoded_bytes: int, encoding: str = "identity") -> None:
+        with self._lock:
+            stats = self._stats.setdefault(
+                endpoint, {"requests": 0, "compressed_requests": 0, "wire_bytes": 0, "decoded_bytes": 0}
+            )
+            stats["requests"] += 1
+            stats["compressed_requests"] += int(encoding != "identity")
+            stats["wire_bytes"] += wire_bytes
+            stats["decoded_bytes"] += decoded_bytes
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def to_frame(self) -> pd.DataFrame:
+        """bytes transferred per endpoint
+
+        Returns:
+            pd.DataFrame: requests, wire_bytes, decoded_bytes, saved_bytes and compression_ratio per endpoint
+        """
+        with self._lock:
+            df = pd.DataFrame.from_dict(self._stats, orient="index")
+        if df.empty:
+            return pd.DataFrame(
+                columns=["requests", "compressed_requests", "wire_bytes", "decoded_bytes", "saved_bytes", "compression_ratio"]
+            )
+        df.index.name = "endpoint"
+        df["saved_bytes"] = df["decoded_bytes"] - df["wire_bytes"]
+        df["compression_ratio"] = df["decoded_bytes"] / df["wire_bytes"].where(df["wire_bytes"] > 0)
+        return df
+
+
+transfer_stats = TransferStats()
+
+
+def iter_content(url: str, endpoint: str, compression: bool = True, chunk_size: int = 65536) -> Iterator[bytes]:
+    """stream the decompressed body of a GET request
+
+    The response is decompressed as it is read and the compressed and
+    decompressed sizes are added to `transfer_stats` under `endpoint`.
+
+    Args:
+        url (str): full url
+        endpoint (str): endpoint label for the byte accounting (e.g. "/actor/{actor_id}")
+        compression (bool): request compressed responses. Defaults to True.
+        chunk_size (int): bytes read at a time. Defaults to 65536.
+
+    Yields:
+        bytes: chunks of the decompressed body
+    """
+    headers = {"Accept": "application/json", "Accept-Encoding": accept_encoding(compression)}
+    decoded_bytes = 0
+    with requests.get(url, headers=headers, stream=True) as response:
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                decoded_bytes += len(chunk)
+                yield chunk
+        finally:
+            transfer_stats.record(
+                endpoint,
+                wire_bytes=response.raw.tell(),
+                decoded_bytes=decoded_bytes,
+                encoding=response.headers.get("Content-Encoding", "identity"),
+            )
+
+
+def get_json(url: str, endpoint: str, compression: bool = True) -> Any:
+    """GET a JSON document
+
+    Args:
+        url (str): full url
+        endpoint (str): endpoint label for the byte accounting (e.g. "/actor/{actor_id}")
+        compression (bool): request compressed responses. Defaults to True.
+
+    Returns:
+        Any: decoded JSON
+    """
+    return json.loads(b"".join(iter_content(url, endpoint, compression=compression)))
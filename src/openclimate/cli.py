@@ -0,0 +1,462 @@
+"""
+Command-line interface of the OpenClimate client
+
+    openclimate fetch emissions US CA GB
+    cat actors.txt | openclimate fetch gdp -i - --workers 4 --concurrency 16 -f jsonl > gdp.jsonl
+    openclimate parts-tree CA --depth 2 -o parts.csv
+    openclimate search --query Minnesota
+    openclimate export emissions-checkpoint -f parquet -o emissions.parquet
+    openclimate fetch targets -i cities.txt --availability availability.jsonl
+    openclimate coverage availability.jsonl --metric targets
+    openclimate diff emissions emissions-2023-01.csv emissions-2023-02.csv -o changes.csv
+    openclimate shard plan shards emissions -i actors.txt --shards 8
+    openclimate shard run shards 3
+    openclimate shard merge shards -f parquet -o emissions.parquet
+"""
+import argparse
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+import json
+import os
+import sys
+import time
+import pandas as pd
+from typing import List, Dict, Set, Tuple, Any, Iterable, Iterator, Optional, TextIO
+
+from .ActorOverview import ActorOverview
+from .Availability import AvailabilityIndex, fetch_overviews
+from .Batch import BatchJob
+from .Diff import Diff
+from .Search import Search
+from .Shard import ShardedJob
+
+FORMATS = ["csv", "jsonl", "parquet"]
+METRICS = ["emissions", "targets", "gdp", "population"]
+
+
+class Writer:
+    """write dataframes incrementally as csv, jsonl or parquet
+
+    Every dataframe is written with the columns of the first one, or of
+    `schema` when given, so chunks with missing columns line up.
+
+    Args:
+        output (str, optional): output path, stdout when None or "-"
+        fmt (str): one of 'csv', 'jsonl' or 'parquet'
+        schema (Dict[str, str], optional): columns and their arrow types, e.g. `BatchJob.schema`
+    """
+
+    def __init__(self, output: Optional[str] = None, fmt: str = "csv", schema: Optional[Dict[str, str]] = None):
+        self.output = None if output in (None, "-") else output
+        self.fmt = fmt
+        self.schema = schema
+        self._columns: Optional[List[str]] = list(schema) if schema else None
+        self.rows = 0
+        self._file: TextIO = sys.stdout
+        self._parquet: Any = None
+        self._header = True
+        if fmt == "parquet":
+            if self.output is None:
+                raise SystemExit("error: parquet output requires --output")
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                raise SystemExit("error: parquet output requires pyarrow, `pip install pyarrow`")
+        elif self.output:
+            self._file = open(self.output, "w", newline="")
+
+    def write(self, df: Optional[pd.DataFrame]) -> None:
+        if df is None or df.empty:
+            return
+        if self._columns is None:
+            self._columns = list(df.columns)
+        df = df.reindex(columns=self._columns)
+        if self.fmt == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            if self._parquet is None:
+                if self.schema:
+                    schema = pa.schema([(col, pa.type_for_alias(type_)) for col, type_ in self.schema.items()])
+                else:
+                    schema = pa.Table.from_pandas(df, preserve_index=False).schema
+                self._parquet = pq.ParquetWriter(self.output, schema)
+            self._parquet.write_table(pa.Table.from_pandas(df, schema=self._parquet.schema, preserve_index=False))
+        elif self.fmt == "jsonl":
+            self._file.write(df.to_json(orient="records", lines=True, force_ascii=False).rstrip("\n") + "\n")
+        else:
+            df.to_csv(self._file, index=False, header=self._header)
+            self._header = False
+        self.rows += len(df)
+
+    def close(self) -> None:
+        if self._parquet is not None:
+            self._parquet.close()
+        if self._file is sys.stdout:
+            self._file.flush()
+        else:
+            self._file.close()
+
+
+class Throughput:
+    """report throughput on stderr
+
+    Args:
+        total (int, optional): number of items expected
+        quiet (bool): do not report anything
+    """
+
+    def __init__(self, total: Optional[int] = None, quiet: bool = False):
+        self.total = total
+        self.quiet = quiet
+        self.done = 0
+        self.start = time.perf_counter()
+
+    def update(self, n: int, rows: int, failed: int = 0) -> None:
+        self.done += n
+        if self.quiet:
+            return
+        elapsed = time.perf_counter() - self.start
+        total = f"/{self.total}" if self.total is not None else ""
+        print(
+            f"\r{self.done}{total} actors  {rows} rows  {failed} failed  {self.done / max(elapsed, 1e-9):.1f} actors/s",
+            end="",
+            file=sys.stderr,
+            flush=True,
+        )
+
+    def finish(self) -> None:
+        if not self.quiet:
+            print(f"\ndone in {time.perf_counter() - self.start:.1f}s", file=sys.stderr)
+
+
+def read_actor_ids(actor_id: List[str], input: Optional[str] = None) -> List[str]:
+    """actor_ids from arguments and from a file or stdin
+
+    one actor_id per line, blank lines and lines starting with # are skipped
+
+    Args:
+        actor_id (List[str]): actor_ids given as arguments
+        input (str, optional): path of a file, or "-" for stdin
+
+    Returns:
+        List[str]: unique actor_ids in input order
+    """
+    actors = list(actor_id)
+    if input:
+        f = sys.stdin if input == "-" else open(input)
+        with f:
+            actors += [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    return list(dict.fromkeys(actors))
+
+
+# availability index of the fetch command running in this worker
+_availability: Optional[AvailabilityIndex] = None
+
+
+def _init_worker(availability: Optional[str] = None) -> None:
+    """load the availability index once per worker of a fetch command
+
+    Args:
+        availability (str, optional): path of an availability index to consult and update
+    """
+    global _availability
+    _availability = AvailabilityIndex(path=availability) if availability else None
+
+
+def fetch_chunk(
+    metric: str, actors: List[str], concurrency: Optional[int] = None
+) -> Tuple[Optional[pd.DataFrame], List[Dict[str, Any]]]:
+    """fetch a metric for a chunk of actors
+
+    runs in a worker process, failures are returned as status records
+
+    Args:
+        metric (str): one of 'emissions', 'targets', 'gdp' or 'population'
+        actors (List[str]): actor codes
+        concurrency (int, optional): maximum number of simultaneous requests
+
+    Returns:
+        Tuple[pd.DataFrame, List[Dict]]: data and status record of each actor
+    """
+    job = BatchJob(metric=metric)
+    overviews = fetch_overviews(
+        actors,
+        metric,
+        _availability,
+        ignore_warnings=True,
+        concurrency=concurrency,
+        return_exceptions=True,
+    )
+    results = [job._process(actor, overview) for actor, overview in zip(actors, overviews)]
+    df_list = [df for _, df in results if df is not None]
+    data = pd.concat(df_list, ignore_index=True) if df_list else None
+    return data, [record for record, _ in results]
+
+
+def _bounded_map(executor: Executor, func, items: Iterable[Any], max_pending: int) -> Iterator[Any]:
+    """map `func` over `items` with at most `max_pending` tasks in flight, yielding results as they complete"""
+    items = iter(items)
+    pending: Set["Future[Any]"] = set()
+    for item in items:
+        pending.add(executor.submit(func, *item))
+        if len(pending) >= max_pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from (future.result() for future in done)
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        yield from (future.result() for future in done)
+
+
+def cmd_fetch(args: argparse.Namespace) -> int:
+    actors = read_actor_ids(args.actor_id, args.input)
+    if not actors:
+        raise SystemExit("error: no actor_ids given")
+    chunks = [
+        (args.metric, actors[start:start + args.chunk_size], args.concurrency)
+        for start in range(0, len(actors), args.chunk_size)
+    ]
+    writer = Writer(args.output, args.format, schema=BatchJob(metric=args.metric).schema)
+    errors = open(args.errors, "w") if args.errors else None
+    progress = Throughput(total=len(actors), quiet=args.quiet)
+    failed = 0
+    executor_class = ProcessPoolExecutor if args.workers > 1 else ThreadPoolExecutor
+    # each fetch command loads the index once per worker, with the records other runs appended since
+    executor = executor_class(max_workers=args.workers, initializer=_init_worker, initargs=(args.availability,))
+    try:
+        with executor:
+            for data, records in _bounded_map(executor, fetch_chunk, chunks, max_pending=2 * args.workers):
+                writer.write(data)
+                failures = [record for record in records if record["status"] not in BatchJob.final_statuses]
+                failed += len(failures)
+                if errors:
+                    errors.writelines(json.dumps(record) + "\n" for record in failures)
+                progress.update(len(records), writer.rows, failed)
+    finally:
+        writer.close()
+        if errors:
+            errors.close()
+    progress.finish()
+    return 1 if failed else 0
+
+
+def cmd_export(args: argparse.Namespace) -> int:
+    result = BatchJob(checkpoint_dir=args.checkpoint_dir).result()
+    writer = Writer(args.output, args.format)
+    try:
+        writer.write(result.data)
+    finally:
+        writer.close()
+    if not args.quiet:
+        counts = result.status["status"].value_counts().to_dict()
+        print(f"{writer.rows} rows  {counts}", file=sys.stderr)
+    return 0
+
+
+def cmd_parts_tree(args: argparse.Namespace) -> int:
+    writer = Writer(args.output, args.format)
+    progress = Throughput(quiet=args.quiet)
+    level = read_actor_ids(args.actor_id, args.input)
+    seen = set(level)
+    columns = ["actor_id", "name", "type", "is_part_of", "depth"]
+
+    def parts(actor: str) -> List[Dict[str, Any]]:
+        return [dict(record, is_part_of=actor) for record in ActorOverview().iter_parts(actor_id=actor)]
+
+    try:
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            for depth in range(1, args.depth + 1):
+                children = []
+                for actor, records in zip(level, executor.map(parts, level)):
+                    records = [record for record in records if record["actor_id"] not in seen]
+                    seen.update(record["actor_id"] for record in records)
+                    children += [record["actor_id"] for record in records]
+                    if records:
+                        writer.write(pd.DataFrame(records).assign(depth=depth).reindex(columns=columns))
+                    progress.update(1, writer.rows)
+                level = children
+    finally:
+        writer.close()
+    progress.finish()
+    return 0
+
+
+def cmd_search(args: argparse.Namespace) -> int:
+    writer = Writer(args.output, args.format)
+    try:
+        for page in Search().iter_search(
+            name=args.name,
+            identifier=args.identifier,
+            query=args.query,
+            language=args.language,
+            namespace=args.namespace,
+            page_size=args.page_size,
+        ):
+            writer.write(pd.DataFrame(page))
+    finally:
+        writer.close()
+    return 0
+
+
+def cmd_coverage(args: argparse.Namespace) -> int:
+    if not os.path.exists(args.index):
+        raise SystemExit(f"error: {args.index} does not exist")
+    actors = read_actor_ids(args.actor_id, args.input)
+    df = AvailabilityIndex(path=args.index).coverage(actor_id=actors or None, metric=args.metric)
+    df["datasources"] = df["datasources"].str.join(";")
+    writer = Writer(args.output, args.format)
+    try:
+        writer.write(df)
+    finally:
+        writer.close()
+    return 0
+
+
+def cmd_diff(args: argparse.Namespace) -> int:
+    result = Diff(chunk_size=args.chunk_size).diff(old=args.old, new=args.new, metric=args.metric)
+    writer = Writer(args.output, args.format)
+    try:
+        writer.write(result.to_frame())
+    finally:
+        writer.close()
+    if not args.quiet:
+        print(result.summary, file=sys.stderr)
+    return 0
+
+
+def cmd_shard_plan(args: argparse.Namespace) -> int:
+    actors = read_actor_ids(args.actor_id, args.input)
+    if not actors:
+        raise SystemExit("error: no actor_ids given")
+    manifest = ShardedJob(root=args.root).plan(actor_id=actors, n_shards=args.shards, metric=args.metric)
+    if not args.quiet:
+        sizes = [len(actors) for actors in manifest.shards]
+        print(f"{len(manifest.actor_ids)} actors in {manifest.n_shards} shards  {sizes}", file=sys.stderr)
+    return 0
+
+
+def cmd_shard_run(args: argparse.Namespace) -> int:
+    job = ShardedJob(root=args.root, concurrency=args.concurrency, chunk_size=args.chunk_size)
+    result = job.run(args.index)
+    if not args.quiet:
+        counts = result.status["status"].value_counts().to_dict()
+        print(f"shard {args.index}  {len(result.data)} rows  {counts}", file=sys.stderr)
+    return 1 if len(result.errors) else 0
+
+
+def cmd_shard_status(args: argparse.Namespace) -> int:
+    progress = ShardedJob(root=args.root).progress()
+    print(progress.to_string(index=False))
+    return 1 if progress["pending"].any() else 0
+
+
+def cmd_shard_merge(args: argparse.Namespace) -> int:
+    job = ShardedJob(root=args.root)
+    try:
+        result = job.merge(allow_incomplete=args.allow_incomplete)
+    except RuntimeError as e:
+        raise SystemExit(f"error: {e}")
+    writer = Writer(args.output, args.format, schema=BatchJob(metric=job.manifest().metric).schema)
+    try:
+        writer.write(result.data)
+    finally:
+        writer.close()
+    if not args.quiet:
+        counts = result.status["status"].value_counts().to_dict()
+        print(f"{writer.rows} rows  {counts}", file=sys.stderr)
+    return 0
+
+
+def parser() -> argparse.ArgumentParser:
+    """command-line argument parser"""
+    main = argparse.ArgumentParser(prog="openclimate", description="OpenClimate API command-line client")
+    commands = main.add_subparsers(dest="command", required=True)
+
+    quiet = argparse.ArgumentParser(add_help=False)
+    quiet.add_argument("-q", "--quiet", action="store_true", help="do not report progress on stderr")
+
+    output = argparse.ArgumentParser(add_help=False, parents=[quiet])
+    output.add_argument("-o", "--output", help="output path [default: stdout]")
+    output.add_argument("-f", "--format", choices=FORMATS, default="csv", help="output format [default: csv]")
+
+    def add_actor_arguments(command: argparse.ArgumentParser) -> None:
+        command.add_argument("actor_id", nargs="*", help="actor codes")
+        command.add_argument("-i", "--input", help="file with one actor_id per line, '-' for stdin")
+
+    fetch = commands.add_parser("fetch", parents=[output], help="fetch a metric for many actors")
+    fetch.add_argument("metric", choices=METRICS)
+    add_actor_arguments(fetch)
+    fetch.add_argument("--concurrency", type=int, default=8, help="simultaneous requests per worker [default: 8]")
+    fetch.add_argument("--workers", type=int, default=1, help="worker processes [default: 1]")
+    fetch.add_argument("--chunk-size", type=int, default=100, help="actors per task [default: 100]")
+    fetch.add_argument("--errors", help="write failed actors as jsonl to this path")
+    fetch.add_argument("--availability", help="availability index to skip actors without data and to update")
+    fetch.set_defaults(func=cmd_fetch)
+
+    export = commands.add_parser("export", parents=[output], help="export the data of a batch checkpoint")
+    export.add_argument("checkpoint_dir", help="checkpoint directory of a batch job")
+    export.set_defaults(func=cmd_export)
+
+    tree = commands.add_parser("parts-tree", parents=[output], help="list the parts of actors recursively")
+    add_actor_arguments(tree)
+    tree.add_argument("--depth", type=int, default=1, help="levels of parts [default: 1]")
+    tree.add_argument("--concurrency", type=int, default=8, help="simultaneous requests [default: 8]")
+    tree.set_defaults(func=cmd_parts_tree)
+
+    search = commands.add_parser("search", parents=[output], help="search actor names and identifiers")
+    group = search.add_mutually_exclusive_group(required=True)
+    group.add_argument("--query", help="full search of identifiers and names")
+    group.add_argument("--name", help="exact name match")
+    group.add_argument("--identifier", help="exact identifier match")
+    search.add_argument("--language", help="two letter language code [requires --name]")
+    search.add_argument("--namespace", help="identifier namespace [requires --identifier]")
+    search.add_argument("--page-size", type=int, default=1000, help="rows written at a time [default: 1000]")
+    search.set_defaults(func=cmd_search)
+
+    coverage = commands.add_parser("coverage", parents=[output], help="query an availability index offline")
+    coverage.add_argument("index", help="availability index written by fetch --availability")
+    add_actor_arguments(coverage)
+    coverage.add_argument("--metric", choices=METRICS, help="only this metric")
+    coverage.set_defaults(func=cmd_coverage)
+
+    diff = commands.add_parser("diff", parents=[output], help="compare two saved pulls of a metric")
+    diff.add_argument("metric", choices=METRICS)
+    diff.add_argument("old", help="earlier csv, jsonl or parquet file")
+    diff.add_argument("new", help="later csv, jsonl or parquet file")
+    diff.add_argument("--chunk-size", type=int, default=1_000_000, help="rows read at a time [default: 1000000]")
+    diff.set_defaults(func=cmd_diff)
+
+    shard = commands.add_parser("shard", help="fetch a metric in shards on several nodes sharing a directory")
+    shard_commands = shard.add_subparsers(dest="shard_command", required=True)
+
+    plan = shard_commands.add_parser("plan", parents=[quiet], help="write the manifest of a sharded job")
+    plan.add_argument("root", help="directory shared by the nodes")
+    plan.add_argument("metric", choices=METRICS)
+    add_actor_arguments(plan)
+    plan.add_argument("--shards", type=int, required=True, help="number of shards")
+    plan.set_defaults(func=cmd_shard_plan)
+
+    run = shard_commands.add_parser("run", parents=[quiet], help="run one shard, resuming from its checkpoint")
+    run.add_argument("root", help="directory shared by the nodes")
+    run.add_argument("index", type=int, help="shard index")
+    run.add_argument("--concurrency", type=int, default=8, help="simultaneous requests [default: 8]")
+    run.add_argument("--chunk-size", type=int, default=100, help="actors fetched between checkpoints [default: 100]")
+    run.set_defaults(func=cmd_shard_run)
+
+    status = shard_commands.add_parser("status", help="number of actors per status in each shard")
+    status.add_argument("root", help="directory shared by the nodes")
+    status.set_defaults(func=cmd_shard_status)
+
+    merge = shard_commands.add_parser("merge", parents=[output], help="validate the shards and concatenate their data")
+    merge.add_argument("root", help="directory shared by the nodes")
+    merge.add_argument("--allow-incomplete", action="store_true", help="merge even if actors are pending or failed")
+    merge.set_defaults(func=cmd_shard_merge)
+    return main
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parser().parse_args(argv)
+    return int(args.func(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
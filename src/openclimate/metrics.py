@@ -0,0 +1,78 @@
+import pandas as pd
+from typing import List, Dict, Union, Tuple, Any, Optional
+
+from .Emissions import Emissions
+from .GDP import GDP
+from .Population import Population
+
+DatasourcePreference = Optional[Union[str, List[str], Tuple[str]]]
+
+VALUE_COLUMNS = {
+    "emissions": "total_emissions",
+    "gdp": "gdp",
+    "population": "population",
+}
+
+
+def metric_frame(overviews: List[Dict[Any, Any]], metric: str) -> pd.DataFrame:
+    """build a long dataframe of a metric from overview dictionaries
+
+    Args:
+        overviews (List[Dict]): list of actor overviews
+        metric (str): one of 'emissions', 'gdp' or 'population'
+
+    Returns:
+        pd.DataFrame: actor_id, year, value and datasource_id columns
+    """
+    getters = {
+        "emissions": Emissions()._get_emissions,
+        "gdp": GDP()._get_gdp,
+        "population": Population()._get_population,
+    }
+    columns = ["actor_id", "year", VALUE_COLUMNS[metric], "datasource_id"]
+    df_list = [
+        getters[metric](overview).loc[:, columns]
+        for overview in overviews
+        if overview and overview.get(metric)
+    ]
+    if not df_list:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(df_list, ignore_index=True)
+
+
+def select_datasource(
+    df: pd.DataFrame, value_column: str, datasource_id: DatasourcePreference = None
+) -> pd.DataFrame:
+    """keep a single datasource per actor
+
+    Datasources listed in `datasource_id` are used in order of preference.
+    Actors with none of the preferred datasources fall back to the datasource
+    with the most years of data (ties are broken alphabetically).
+
+    Args:
+        df (pd.DataFrame): long dataframe from `metric_frame`
+        value_column (str): name of the value column
+        datasource_id (str|List[str], optional): datasource preference
+
+    Returns:
+        pd.DataFrame: dataframe with one datasource per actor
+    """
+    if df.empty:
+        return df
+    preference = [datasource_id] if isinstance(datasource_id, str) else list(datasource_id or [])
+    rank = {datasource: position for position, datasource in enumerate(preference)}
+    candidates = (
+        df.dropna(subset=[value_column])
+        .groupby(["actor_id", "datasource_id"], as_index=False)
+        .agg(n_years=("year", "nunique"))
+    )
+    candidates["rank"] = candidates["datasource_id"].map(rank).fillna(len(preference))
+    chosen = (
+        candidates.sort_values(
+            by=["actor_id", "rank", "n_years", "datasource_id"],
+            ascending=[True, True, False, True],
+        )
+        .drop_duplicates(subset=["actor_id"])
+        .loc[:, ["actor_id", "datasource_id"]]
+    )
+    return df.merge(chosen, on=["actor_id", "datasource_id"], how="inner")
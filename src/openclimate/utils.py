@@ -1,7 +1,11 @@
 import asyncio
-from functools import wraps
+import codecs
+from functools import partial, wraps
+import json
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any
+import sys
+from typing import List, Dict, Tuple, Any, Iterable, Iterator, Optional
 import warnings
 
 
@@ -23,6 +27,101 @@ def explode_dict_columns(df: pd.DataFrame = None) -> pd.DataFrame:
     return df
 
 
+BACKENDS = ["pandas", "arrow", "polars"]
+
+
+def check_backend(backend: str) -> None:
+    """raise if the result backend is unknown or its package is not installed
+
+    Args:
+        backend (str): one of 'pandas', 'arrow' or 'polars'
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"BackendError: backend {backend} not in {BACKENDS}")
+    package = {"pandas": "pandas", "arrow": "pyarrow", "polars": "polars"}[backend]
+    try:
+        __import__(package)
+    except ImportError:
+        raise ImportError(f"the {backend} backend requires {package}, `pip install {package}`")
+
+
+def flatten_record(record: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """expand nested dictionaries into `parent_child` keys, like `explode_dict_columns`
+
+    Args:
+        record (Dict): record with nested dictionaries
+        prefix (str): prefix of the keys
+
+    Returns:
+        Dict: flat record
+    """
+    flat: Dict[str, Any] = {}
+    for key, value in record.items():
+        if isinstance(value, dict):
+            flat.update(flatten_record(value, prefix=f"{prefix}{key}_"))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def records_to_frame(records: List[Dict[str, Any]], columns: Optional[List[str]] = None, backend: str = "pandas") -> Any:
+    """build a dataframe of the result backend directly from records
+
+    Args:
+        records (List[Dict]): flat records
+        columns (List[str], optional): columns in output order. Defaults to the keys of the first record.
+        backend (str): one of 'pandas', 'arrow' or 'polars'
+
+    Returns:
+        pd.DataFrame|pyarrow.Table|polars.DataFrame
+    """
+    check_backend(backend)
+    if columns is None:
+        columns = list(records[0]) if records else []
+    if backend == "pandas":
+        return pd.DataFrame(records, columns=columns)
+    data = {col: [record.get(col) for record in records] for col in columns}
+    if backend == "arrow":
+        import pyarrow as pa
+
+        return pa.table(data)
+    import polars as pl
+
+    return pl.DataFrame(data, strict=False)
+
+
+def normalize_datasources(
+    df: pd.DataFrame, datasources: Optional[pd.DataFrame] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """split datasource columns into a de-duplicated datasource table
+
+    The fact table keeps a compact int32 `datasource_key` in place of `datasource_id`
+    and the `datasource_*` columns. The datasource table has one row per
+    datasource with interned strings, join back on `datasource_key`.
+
+    Args:
+        df (pd.DataFrame): dataframe with a datasource_id column
+        datasources (pd.DataFrame, optional): datasource_id and descriptive columns.
+            Defaults to the `datasource_*` columns of `df`.
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: fact table and datasource table
+    """
+    columns = ["datasource_id"] + [col for col in df.columns if col.startswith("datasource_") and col != "datasource_id"]
+    if datasources is None:
+        datasources = df.loc[:, columns]
+    df_datasources = datasources.drop_duplicates(subset=["datasource_id"]).reset_index(drop=True)
+    for col in df_datasources.columns:
+        df_datasources[col] = df_datasources[col].map(lambda x: sys.intern(x) if isinstance(x, str) else x)
+    df_datasources.insert(0, "datasource_key", np.arange(len(df_datasources), dtype="int32"))
+
+    keys = pd.Index(df_datasources["datasource_id"]).get_indexer(df["datasource_id"]).astype("int32")
+    position = list(df.columns).index("datasource_id")
+    df_facts = df.drop(columns=columns)
+    df_facts.insert(min(position, len(df_facts.columns)), "datasource_key", keys)
+    return df_facts, df_datasources
+
+
 def async_func(func):
     """decorator to turn a synchronous function into async
 
@@ -34,9 +133,9 @@ def async_func(func):
     """
 
     @wraps(func)
-    async def wrapper():
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, func)
+    async def wrapper(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
 
     return wrapper
 
@@ -62,3 +161,173 @@ def filter_overviews(overviews: List[Dict[Any, Any]], key: str, ignore_warnings:
                 f"NoDataError: {overview.get('actor_id')} has no {key} data", category=UserWarning
             )
     return filtered_overviews
+
+
+def read_jsonl(path: str) -> List[Dict[str, Any]]:
+    """records of an append-only JSON lines file
+
+    a partially written last line from an interrupted run is skipped
+
+    Args:
+        path (str): path of the file
+
+    Returns:
+        List[Dict]: records in file order
+    """
+    records = []
+    with open(path) as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records
+
+
+def read_csv(path: str, text_columns: Iterable[str] = ("actor_id",), **kwargs) -> Any:
+    """read a csv file of metric data
+
+    only empty fields are missing values, so actor_ids such as "NA" (Namibia) are kept
+
+    Args:
+        path (str): path of the file
+        text_columns (Iterable[str]): columns read as strings. Defaults to actor_id.
+        **kwargs: arguments of `pd.read_csv`, e.g. nrows or chunksize
+
+    Returns:
+        pd.DataFrame: or a reader of dataframes when chunksize is given
+    """
+    dtype = {col: str for col in text_columns}
+    return pd.read_csv(path, dtype=dtype, keep_default_na=False, na_values=[""], **kwargs)
+
+
+class _JSONStream:
+    """incremental reader of a JSON document from an iterable of byte chunks
+
+    Only the unparsed remainder of the document is kept in memory.
+    """
+
+    _whitespace = " \t\n\r"
+    _number_chars = "0123456789.eE+-"
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self.chunks = iter(chunks)
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, min_size: int = 1) -> bool:
+        """read at least `min_size` more characters, returns False at end of stream"""
+        if self.eof:
+            return False
+        self.buffer = self.buffer[self.pos:]
+        self.pos = 0
+        size = len(self.buffer)
+        for chunk in self.chunks:
+            self.buffer += self.text_decoder.decode(chunk)
+            if len(self.buffer) - size >= min_size:
+                return True
+        self.buffer += self.text_decoder.decode(b"", final=True)
+        self.eof = True
+        return len(self.buffer) > size
+
+    def peek(self) -> str:
+        """next non-whitespace character, empty string at end of stream"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in self._whitespace:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """consume the next character, which must be one of `chars`"""
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", self.buffer, self.pos)
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        """decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # the value is incomplete, grow the buffer geometrically to keep parsing linear
+                if self.fill(min_size=max(len(self.buffer) - self.pos, 1)):
+                    continue
+                raise
+            # a number may continue in the next chunk, either right at the end of the
+            # buffer or after a partial fraction or exponent such as `12.` or `2e+`
+            tail = self.buffer[end:end + 3]
+            is_number = isinstance(obj, (int, float)) and not isinstance(obj, bool)
+            at_end = end + len(tail) == len(self.buffer) and (
+                not tail or (is_number and not tail.strip(self._number_chars))
+            )
+            if at_end and self.fill():
+                continue
+            self.pos = end
+            return obj
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str = "data") -> Iterator[Any]:
+    """yield the items of an array in a JSON object one at a time
+
+    Reads a document like `{"data": [{...}, {...}]}` incrementally from byte chunks
+    (e.g. `response.iter_content()`), so neither the raw body nor the whole list is
+    held in memory.
+
+    Args:
+        chunks (Iterable[bytes]): chunks of the response body
+        key (str): key of the array in the top-level object. Defaults to "data".
+
+    Raises:
+        KeyError: `key` is not in the document or is not an array
+
+    Yields:
+        Any: items of the array
+    """
+    stream = _JSONStream(chunks)
+    stream.expect("{")
+    if stream.peek() == "}":
+        raise KeyError(key)
+    while True:
+        name = stream.value()
+        stream.expect(":")
+        if name == key and stream.peek() == "[":
+            stream.expect("[")
+            if stream.peek() == "]":
+                return
+            while True:
+                yield stream.value()
+                if stream.expect(",]") == "]":
+                    return
+        stream.value()
+        if stream.expect(",}") == "}":
+            raise KeyError(key)
+
+
+def iter_pages(records: Iterable[Dict[Any, Any]], page_size: int, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """group records into dataframes of `page_size` rows
+
+    Args:
+        records (Iterable[Dict]): records
+        page_size (int): number of rows per dataframe
+        columns (List[str], optional): columns to keep
+
+    Yields:
+        pd.DataFrame: dataframe of at most `page_size` rows
+    """
+    page = []
+    for record in records:
+        page.append(record)
+        if len(page) >= page_size:
+            yield pd.DataFrame(page, columns=columns)
+            page = []
+    if page:
+        yield pd.DataFrame(page, columns=columns)
@@ -0,0 +1,124 @@
+import pandas as pd
+import pytest
+
+from openclimate.ActorOverview import ActorOverview
+
+
+def _datasource(datasource_id, name):
+    return {
+        "datasource_id": datasource_id,
+        "name": name,
+        "publisher": "publisher",
+        "published": "2022-11-01T00:00:00.000Z",
+        "URL": f"https://example.org/{datasource_id}",
+    }
+
+
+def _overview(actor_id, scale, years=range(2000, 2006)):
+    return {
+        "actor_id": actor_id,
+        "name": actor_id,
+        "type": "country",
+        "emissions": {
+            "DS:emissions:a": {
+                "datasource_id": "DS:emissions:a",
+                "name": "emissions a",
+                "publisher": "publisher",
+                "published": "2022-11-01T00:00:00.000Z",
+                "URL": "https://example.org/a",
+                "data": [
+                    {
+                        "emissions_id": f"DS:emissions:a:{actor_id}:{year}",
+                        "total_emissions": scale * (200 - year + 2000),
+                        "year": year,
+                        "tags": [],
+                    }
+                    for year in years
+                ],
+            },
+            "DS:emissions:b": {
+                "datasource_id": "DS:emissions:b",
+                "name": "emissions b",
+                "publisher": "publisher",
+                "published": "2022-11-01T00:00:00.000Z",
+                "URL": "https://example.org/b",
+                "data": [
+                    {
+                        "emissions_id": f"DS:emissions:b:{actor_id}:2000",
+                        "total_emissions": scale * 500,
+                        "year": 2000,
+                        "tags": [],
+                    }
+                ],
+            },
+        },
+        "gdp": [
+            {
+                "gdp": scale * 1000 * (year - 1990),
+                "year": year,
+                "datasource_id": "DS:gdp",
+                "datasource": _datasource("DS:gdp", "gdp"),
+            }
+            for year in years
+        ],
+        "population": [
+            {
+                "population": scale * 10,
+                "year": year,
+                "datasource_id": "DS:population",
+                "datasource": _datasource("DS:population", "population"),
+            }
+            for year in years
+        ],
+        "targets": [
+            {
+                "target_type": "Absolute emission reduction",
+                "baseline_year": 2000,
+                "baseline_value": None,
+                "target_year": 2030,
+                "target_value": 50,
+                "target_unit": "percent",
+                "datasource_id": "DS:targets",
+                "datasource": _datasource("DS:targets", "targets"),
+                "initiative": {
+                    "initiative_id": "NDC",
+                    "name": "NDC",
+                    "description": "description",
+                    "URL": "https://example.org/ndc",
+                },
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def overviews():
+    """offline actor overviews keyed by actor_id"""
+    data = {
+        "AA": _overview("AA", 1),
+        "AA-1": _overview("AA-1", 0.25),
+        "AA-2": _overview("AA-2", 0.5),
+        "BB": _overview("BB", 2),
+    }
+    data["BB"]["targets"] = []
+    data["BB"]["population"] = []
+    return data
+
+
+@pytest.fixture
+def offline(monkeypatch, overviews):
+    """serve actor overviews from the `overviews` fixture instead of the API"""
+
+    def overview(self, actor_id, ignore_warnings=False, *args, **kwargs):
+        actor_list = [actor_id] if isinstance(actor_id, str) else actor_id
+        return [overviews.get(actor) for actor in actor_list]
+
+    def parts(self, actor_id, part_type=None, *args, **kwargs):
+        children = [actor for actor in ["AA-1", "AA-2", "AA-3"] if actor.startswith(f"{actor_id}-")]
+        if not children:
+            return None
+        return pd.DataFrame({"actor_id": children, "name": children, "type": "adm1"})
+
+    monkeypatch.setattr(ActorOverview, "overview", overview)
+    monkeypatch.setattr(ActorOverview, "parts", parts)
+    return overviews
@@ -0,0 +1,86 @@
+import openclimate
+import pytest
+
+from openclimate.ActorOverview import ActorOverview
+from openclimate.Availability import AvailabilityIndex
+from openclimate.Population import Population
+from openclimate.cli import main
+
+
+@pytest.fixture
+def calls(offline, monkeypatch):
+    """actor lists requested from the API"""
+    calls = []
+
+    def overview(self, actor_id, *args, **kwargs):
+        calls.append(list(actor_id))
+        return [offline.get(actor) for actor in actor_id]
+
+    monkeypatch.setattr(ActorOverview, "overview", overview)
+    return calls
+
+
+def test_availability(calls, tmp_path):
+    client = openclimate.Client()
+    path = str(tmp_path / "availability.jsonl")
+    availability = AvailabilityIndex(path=path)
+
+    df = client.population(actor_id=["AA", "BB", "XX"], ignore_warnings=True, availability=availability)
+    assert df["actor_id"].unique().tolist() == ["AA"]
+    # XX was not found, which is not recorded so that it is requested again
+    assert len(availability) == 2 * 4
+
+    coverage = AvailabilityIndex(path=path).coverage(metric="emissions").set_index("actor_id")
+    assert coverage.loc["AA", ["has_data", "first_year", "last_year", "n_years"]].tolist() == [True, 2000, 2005, 6]
+    assert coverage.loc["AA", "datasources"] == ["DS:emissions:a", "DS:emissions:b"]
+    assert "XX" not in coverage.index
+
+    # BB has no targets and is not requested again, XX is
+    with pytest.warns(UserWarning, match="BB has no targets"):
+        df = client.targets(actor_id=["AA", "BB", "XX"], availability=AvailabilityIndex(path=path))
+    assert calls[-1] == ["AA", "XX"]
+    assert df["actor_id"].unique().tolist() == ["AA"]
+
+    # only actors known to be empty, nothing is requested
+    n_calls = len(calls)
+    df = client.targets(actor_id=["BB"], ignore_warnings=True, availability=AvailabilityIndex(path=path))
+    assert len(calls) == n_calls
+    assert df.empty and "initiative_id" in df.columns
+    df = client.population(actor_id=["BB"], ignore_warnings=True, availability=AvailabilityIndex(path=path))
+    assert len(calls) == n_calls
+    assert df.empty and df.columns.tolist() == Population.columns
+    # none of the actors exist
+    assert client.population(actor_id="XX", availability=AvailabilityIndex(path=path)) is None
+
+    result = client.batch(
+        actor_id=["BB", "XX", "AA-1"],
+        metric="population",
+        checkpoint_dir=str(tmp_path / "checkpoint"),
+        availability=AvailabilityIndex(path=path),
+    )
+    assert calls[-1] == ["XX", "AA-1"]
+    assert result.status.set_index("actor_id")["status"].to_dict() == {"BB": "no_data", "XX": "not_found", "AA-1": "ok"}
+
+    # expired records are fetched again
+    client.population(actor_id=["AA", "BB"], ignore_warnings=True, availability=AvailabilityIndex(path=path, max_age=0))
+    assert calls[-1] == ["AA", "BB"]
+
+    index = AvailabilityIndex(path=path)
+    index.compact()
+    assert sum(1 for _ in open(path)) == len(index) == 3 * 4
+
+
+def test_cli_coverage(calls, tmp_path, capsys):
+    path = str(tmp_path / "availability.jsonl")
+    assert main(["fetch", "targets", "AA", "BB", "-q", "--availability", path]) == 0
+    assert main(["fetch", "targets", "AA", "BB", "-q", "--availability", path]) == 0
+    assert calls[-1] == ["AA"]
+
+    # records appended by another process are read by the next fetch command
+    AvailabilityIndex(path=path).update(["CC"], [{"actor_id": "CC", "targets": []}])
+    assert main(["fetch", "targets", "AA", "CC", "-q", "--availability", path]) == 0
+    assert calls[-1] == ["AA"]
+
+    capsys.readouterr()
+    assert main(["coverage", path, "BB", "--metric", "targets", "-f", "jsonl"]) == 0
+    assert '"has_data":false' in capsys.readouterr().out
@@ -0,0 +1,36 @@
+import openclimate
+import pytest
+
+from openclimate.ActorOverview import ActorOverview
+from openclimate.Batch import BatchJob
+
+
+def test_batch(offline, monkeypatch, tmp_path):
+    calls = []
+    flaky = {"AA-2"}
+
+    def overview(self, actor_id, *args, **kwargs):
+        calls.append(list(actor_id))
+        return [RuntimeError("boom") if actor in flaky else offline.get(actor) for actor in actor_id]
+
+    monkeypatch.setattr(ActorOverview, "overview", overview)
+    client = openclimate.Client()
+    checkpoint_dir = str(tmp_path / "checkpoint")
+
+    result = client.batch(actor_id=["AA", "AA-2", "XX", "BB"], metric="targets", checkpoint_dir=checkpoint_dir, chunk_size=2)
+    assert calls == [["AA", "AA-2"], ["XX", "BB"]]
+    assert result.data["actor_id"].unique().tolist() == ["AA"]
+    status = result.status.set_index("actor_id")["status"].to_dict()
+    assert status == {"AA": "ok", "AA-2": "failed", "XX": "not_found", "BB": "no_data"}
+    assert result.errors.set_index("actor_id").loc["AA-2", "error_type"] == "RuntimeError"
+
+    flaky.clear()
+    result = client.batch(actor_id=["AA", "AA-2", "XX", "BB"], metric="targets", checkpoint_dir=checkpoint_dir)
+    assert calls[-1] == ["AA-2", "XX"]
+    assert sorted(result.data["actor_id"].unique()) == ["AA", "AA-2"]
+    assert result.errors["actor_id"].tolist() == ["XX"]
+
+
+def test_batch_metric():
+    with pytest.raises(ValueError):
+        BatchJob(metric="not_a_metric")
@@ -0,0 +1,77 @@
+import pandas as pd
+import pytest
+
+from openclimate.Diff import Diff
+from openclimate.Emissions import Emissions
+from openclimate.Targets import Targets
+
+
+def _emissions(overviews):
+    return pd.concat([Emissions()._get_emissions(overview) for overview in overviews.values()], ignore_index=True)
+
+
+@pytest.mark.parametrize("snapshot", [None, "csv", "jsonl", "parquet"])
+def test_diff(overviews, tmp_path, snapshot, monkeypatch):
+    old = _emissions(overviews)
+    new = old.copy()
+    new.loc[(new["actor_id"] == "AA") & (new["year"] == 2003), "total_emissions"] += 5
+    new.loc[(new["actor_id"] == "BB") & (new["year"] == 2005), "total_emissions"] = None
+    new = new.loc[~((new["actor_id"] == "AA-1") & (new["datasource_id"] == "DS:emissions:b"))]
+    new = pd.concat([new, new.iloc[[0]].assign(actor_id="NA")], ignore_index=True)
+    new = new.sample(frac=1, random_state=0)
+
+    if snapshot:
+        paths = [str(tmp_path / f"old.{snapshot}"), str(tmp_path / f"new.{snapshot}")]
+        for df, path in zip([old, new], paths):
+            if snapshot == "csv":
+                df.to_csv(path, index=False)
+            elif snapshot == "parquet":
+                df.to_parquet(path, index=False)
+            else:
+                df.to_json(path, orient="records", lines=True)
+        old, new = paths
+
+    # sources are read in full to hash and to select the removed, added and changed rows,
+    # their columns and dtypes come from a sample
+    reads = []
+    iter_chunks = Diff._iter_chunks
+
+    def counting_iter_chunks(self, source):
+        reads.append(source if isinstance(source, str) else id(source))
+        return iter_chunks(self, source)
+
+    monkeypatch.setattr(Diff, "_iter_chunks", counting_iter_chunks)
+    result = Diff(chunk_size=7).diff(old, new, metric="emissions")
+    assert max(reads.count(source) for source in reads) == (3 if snapshot else 1)
+    assert result.summary == {"added": 1, "removed": 1, "changed": 2, "unchanged": len(_emissions(overviews)) - 3}
+    assert result.added["actor_id"].tolist() == ["NA"]
+    assert result.removed[["actor_id", "datasource_id"]].values.tolist() == [["AA-1", "DS:emissions:b"]]
+
+    changed = result.changed.set_index("actor_id")
+    assert changed.loc["AA", "total_emissions_delta"] == 5
+    assert changed.loc["AA", "total_emissions_new"] - changed.loc["AA", "total_emissions_old"] == 5
+    assert pd.isna(changed.loc["BB", "total_emissions_delta"])
+    assert result.to_frame()["change"].value_counts().to_dict() == {"changed": 2, "added": 1, "removed": 1}
+
+
+def test_diff_targets(overviews):
+    old = Targets()._get_target(overviews["AA"])
+    new = old.assign(target_value=40)
+    result = Diff().diff(old, new, metric="targets")
+    assert result.changed["target_value_delta"].tolist() == [-10]
+    assert result.changed["target_unit_new"].tolist() == ["percent"]
+
+    assert Diff().diff(old, old, metric="targets").summary["changed"] == 0
+    with pytest.raises(ValueError):
+        Diff().diff(pd.concat([old, old]), new, metric="targets")
+
+
+def test_cli_diff(overviews, tmp_path):
+    from openclimate.cli import main
+
+    old, new, output = (str(tmp_path / name) for name in ["old.csv", "new.csv", "changes.csv"])
+    df = _emissions(overviews)
+    df.to_csv(old, index=False)
+    df.assign(total_emissions=df["total_emissions"] * 2).to_csv(new, index=False)
+    assert main(["diff", "emissions", old, new, "-o", output, "-q"]) == 0
+    assert (pd.read_csv(output)["change"] == "changed").sum() == len(df)
@@ -0,0 +1,26 @@
+import openclimate
+import pytest
+
+
+def test_panel(offline):
+    client = openclimate.Client()
+    df = client.panel(actor_id=["AA", "BB"])
+
+    assert set(df["emissions_datasource_id"].dropna()) == {"DS:emissions:a"}
+    assert len(df) == 12
+
+    row = df.loc[(df["actor_id"] == "AA") & (df["year"] == 2001)].iloc[0]
+    assert row["emissions_per_capita"] == pytest.approx(199 / 10)
+    assert row["emissions_intensity"] == pytest.approx(199 / 11000)
+    assert row["total_emissions_yoy"] == pytest.approx(199 / 200 - 1)
+    assert df.loc[df["actor_id"] == "BB", "emissions_per_capita"].isna().all()
+
+
+def test_panel_datasource_preference(offline):
+    client = openclimate.Client()
+    df = client.panel(actor_id="AA", emissions_datasource_id=["not_a_datasource", "DS:emissions:b"])
+    assert set(df["emissions_datasource_id"].dropna()) == {"DS:emissions:b"}
+    assert df.loc[df["year"] == 2000, "total_emissions"].item() == 500
+
+    wide = client.panel(actor_id=["AA", "BB"], wide=True)
+    assert wide["gdp"].columns.tolist() == ["AA", "BB"]
@@ -0,0 +1,70 @@
+import openclimate
+import pandas as pd
+import pytest
+
+from openclimate.Progress import Progress
+
+
+def test_progress(offline):
+    client = openclimate.Client()
+    df = client.progress(actor_id=["AA", "BB"], datasource_id="DS:emissions:a")
+
+    assert df["actor_id"].tolist() == ["AA"]
+    row = df.iloc[0]
+    assert row["baseline_emissions"] == 200
+    assert row["target_emissions"] == 100
+    assert row["latest_year"] == 2005
+    assert row["reduction_to_date"] == pytest.approx(1 - 195 / 200)
+    assert row["required_annual_rate"] == pytest.approx(1 - (100 / 195) ** (1 / 25))
+    assert row["projected_emissions"] == pytest.approx(170)
+    assert not row["on_track"]
+
+
+def test_progress_evaluate():
+    targets = pd.DataFrame(
+        {
+            "actor_id": ["X", "X", "Y", "X"],
+            "target_type": ["Absolute emission reduction"] * 3 + ["Emission intensity reduction"],
+            "baseline_year": [2000, 2000, 2000, 2000],
+            "target_year": [2010, 2010, 2010, 2010],
+            "target_value": [50, 10, 50, 50],
+            "target_unit": ["percent", "percent", "tCO2e", "percent"],
+        }
+    )
+    emissions = pd.DataFrame(
+        {
+            "actor_id": ["X"] * 3 + ["Y"] * 3,
+            "year": [2000, 2001, 2002] * 2,
+            "total_emissions": [100, 90, 80, 100, 100, 100],
+        }
+    )
+    df = Progress()._evaluate(targets, emissions, trend_years=3)
+
+    assert df["projected_emissions"].tolist() == pytest.approx([0, 0, 100, 0])
+    assert df["on_track"].tolist()[:2] == [True, True]
+    # neither an absolute target in tCO2e nor an intensity target in percent is evaluated
+    assert df["on_track"].isna().tolist() == [False, False, True, True]
+    assert df["target_emissions"].isna().tolist() == [False, False, True, True]
+    assert df["target_reduction"].isna().tolist() == [False, False, True, True]
+
+
+def test_progress_past_target():
+    targets = pd.DataFrame(
+        {
+            "actor_id": ["X", "X", "X"],
+            "target_type": "Absolute emission reduction",
+            "baseline_year": [2000, 2000, 2000],
+            "target_year": [2001, 2002, 1999],
+            "target_value": [5, 5, 5],
+            "target_unit": ["percent", "percent", "percent"],
+        }
+    )
+    emissions = pd.DataFrame({"actor_id": "X", "year": [2000, 2001, 2002], "total_emissions": [100, 90, 98]})
+    df = Progress()._evaluate(targets, emissions, trend_years=3)
+
+    assert df["years_remaining"].tolist() == [0, 0, 0]
+    assert df["projected_emissions"].tolist()[:2] == [90, 98]
+    assert df["projected_emissions"].isna().tolist() == [False, False, True]
+    assert df["on_track"].tolist()[:2] == [True, False]
+    assert df["on_track"].isna().tolist() == [False, False, True]
+    assert df["required_annual_rate"].isna().all()
@@ -0,0 +1,56 @@
+import openclimate
+import pandas as pd
+import pytest
+
+from openclimate.ActorOverview import ActorOverview
+
+
+def test_rollup(offline):
+    client = openclimate.Client()
+    result = client.rollup(actor_id="AA", metric="emissions")
+
+    assert result.missing == ["AA-3"]
+    assert result.totals["part_type"].unique().tolist() == ["adm1"]
+    row = result.totals.loc[
+        (result.totals["year"] == 2000) & (result.totals["datasource_id"] == "DS:emissions:a")
+    ].iloc[0]
+    assert row["parent_total"] == 200
+    assert row["parts_total"] == pytest.approx(150)
+    assert row["n_parts_reporting"] == 2
+    assert row["coverage"] == pytest.approx(2 / 3)
+    assert row["difference"] == pytest.approx(50)
+
+    assert client.rollup(actor_id="BB") is None
+    with pytest.raises(ValueError):
+        client.rollup(actor_id="AA", metric="targets")
+
+
+def test_rollup_part_types(offline, monkeypatch):
+    def parts(self, actor_id, part_type=None, *args, **kwargs):
+        return pd.DataFrame({"actor_id": ["AA-1", "AA-2", "AA-3"], "name": "", "type": ["adm1", "city", "adm1"]})
+
+    monkeypatch.setattr(ActorOverview, "parts", parts)
+    totals = openclimate.Client().rollup(actor_id="AA").totals
+    totals = totals.loc[(totals["year"] == 2000) & (totals["datasource_id"] == "DS:emissions:a")].set_index("part_type")
+
+    assert totals["parent_total"].tolist() == [200, 200]
+    assert totals.loc["adm1", ["parts_total", "n_parts_reporting", "n_parts", "coverage"]].tolist() == [50, 1, 2, 0.5]
+    assert totals.loc["city", ["parts_total", "n_parts_reporting", "n_parts", "coverage"]].tolist() == [100, 1, 1, 1]
+
+
+def test_rollup_failed_parts(offline, monkeypatch):
+    def overview(self, actor_id, ignore_warnings=False, concurrency=None, return_exceptions=False):
+        results = [ConnectionError("reset") if actor == "AA-2" else offline.get(actor) for actor in actor_id]
+        if not return_exceptions and any(isinstance(result, Exception) for result in results):
+            raise ConnectionError("reset")
+        return results
+
+    monkeypatch.setattr(ActorOverview, "overview", overview)
+    result = openclimate.Client().rollup(actor_id="AA")
+
+    assert result.failed == ["AA-2"]
+    assert result.missing == ["AA-2", "AA-3"]
+    assert result.coverage.set_index("actor_id").loc["AA-2", "error"] == "ConnectionError: reset"
+    row = result.totals.loc[(result.totals["year"] == 2000) & (result.totals["datasource_id"] == "DS:emissions:a")].iloc[0]
+    assert row["parts_total"] == pytest.approx(50)
+    assert row["coverage"] == pytest.approx(1 / 3)
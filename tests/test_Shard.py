@@ -0,0 +1,70 @@
+import pytest
+
+from openclimate.Shard import ShardedJob, ShardManifest, shard_of
+from openclimate.cli import main
+
+
+def test_shard_of():
+    actors = [f"US-{i}" for i in range(1000)]
+    shards = [shard_of(actor, 4) for actor in actors]
+    assert shards == [shard_of(actor, 4) for actor in actors]
+    assert set(shards) == {0, 1, 2, 3}
+
+    manifest = ShardManifest(metric="emissions", n_shards=4, actor_ids=actors)
+    assert sorted(sum((manifest.shard(index) for index in range(4)), [])) == sorted(actors)
+    assert manifest.shard(1) == [actor for actor, shard in zip(actors, shards) if shard == 1]
+
+
+def test_shard_hashes_once(monkeypatch):
+    calls = []
+
+    def counting_shard_of(actor_id, n_shards):
+        calls.append(actor_id)
+        return shard_of(actor_id, n_shards)
+
+    monkeypatch.setattr("openclimate.Shard.shard_of", counting_shard_of)
+    actors = [f"US-{i}" for i in range(100)]
+    manifest = ShardManifest(metric="emissions", n_shards=8, actor_ids=actors)
+    for index in range(8):
+        manifest.shard(index)
+    assert sorted(calls) == sorted(actors)
+
+
+def test_sharded_job(offline, tmp_path):
+    actors = ["AA", "AA-1", "AA-2", "BB", "XX"]
+    root = str(tmp_path / "shards")
+    manifest = ShardedJob(root=root).plan(actor_id=actors, n_shards=3, metric="gdp")
+    assert ShardedJob(root=root).manifest() == manifest
+    with pytest.raises(ValueError):
+        ShardedJob(root=root).plan(actor_id=actors, n_shards=2, metric="gdp")
+
+    # each node only sees the shared directory
+    for index in range(3):
+        ShardedJob(root=root).run(index)
+    with pytest.raises(RuntimeError):
+        ShardedJob(root=root).merge()
+
+    result = ShardedJob(root=root).merge(allow_incomplete=True)
+    assert sorted(result.data["actor_id"].unique()) == ["AA", "AA-1", "AA-2", "BB"]
+    assert result.errors["actor_id"].tolist() == ["XX"]
+    assert result.status.set_index("actor_id").loc["XX", "shard"] == shard_of("XX", 3)
+
+    offline["XX"] = dict(offline["BB"], actor_id="XX")
+    ShardedJob(root=root).run(shard_of("XX", 3))
+    result = ShardedJob(root=root).merge()
+    assert len(result.data) == 5 * 6
+    assert ShardedJob(root=root).progress()["pending"].sum() == 0
+
+
+def test_cli_shard(offline, tmp_path, capsys):
+    root = str(tmp_path / "shards")
+    assert main(["shard", "plan", root, "population", "AA", "AA-1", "XX", "--shards", "2", "-q"]) == 0
+    assert main(["shard", "status", root]) == 1
+    # only the shard of XX, which is not found, has failed actors
+    for index in range(2):
+        assert main(["shard", "run", root, str(index), "-q"]) == int(index == shard_of("XX", 2))
+    with pytest.raises(SystemExit):
+        main(["shard", "merge", root, "-q"])
+    output = str(tmp_path / "population.csv")
+    assert main(["shard", "merge", root, "--allow-incomplete", "-o", output, "-q"]) == 0
+    assert sum(1 for _ in open(output)) == 1 + 2 * 6
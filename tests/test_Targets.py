@@ -0,0 +1,9 @@
+from openclimate.Targets import Targets
+
+
+def test_get_target(overviews):
+    df = Targets()._get_target(overviews["AA"])
+    assert df.columns.tolist() == [Targets.renames.get(col, col) for col in Targets.columns]
+    assert df.loc[0, "datasource_name"] == "targets"
+    assert df.loc[0, "datasource_URL"] == "https://example.org/DS:targets"
+    assert df.loc[0, "initiative_id"] == "NDC"
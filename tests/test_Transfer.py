@@ -0,0 +1,55 @@
+import gzip
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+
+import pytest
+
+from openclimate.ActorOverview import ActorOverview
+from openclimate.Transfer import transfer_stats
+
+
+@pytest.fixture
+def server():
+    body = json.dumps({"data": {"actor_id": "AA", "emissions": {"DS": {"data": [{"year": y} for y in range(2000)]}}}}).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            content = body
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                content = gzip.compress(body)
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/api/v1", len(body)
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_compressed_transfer(server):
+    url, size = server
+    transfer_stats.reset()
+    overviews = ActorOverview(server=url).overview(actor_id=["AA", "AA"])
+    assert len(overviews[0]["emissions"]["DS"]["data"]) == 2000
+
+    stats = transfer_stats.to_frame().loc["/actor/{actor_id}"]
+    assert stats["requests"] == 2
+    assert stats["compressed_requests"] == 2
+    assert stats["decoded_bytes"] == 2 * size
+    assert stats["wire_bytes"] < stats["decoded_bytes"] / 5
+
+    transfer_stats.reset()
+    ActorOverview(server=url, compression=False).overview(actor_id="AA")
+    stats = transfer_stats.to_frame().loc["/actor/{actor_id}"]
+    assert stats["compressed_requests"] == 0
+    assert stats["wire_bytes"] == stats["decoded_bytes"] == size
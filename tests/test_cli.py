@@ -0,0 +1,38 @@
+import io
+import json
+
+import pandas as pd
+
+from openclimate import cli
+from openclimate.Batch import BatchJob
+
+
+def test_fetch(offline, tmp_path, monkeypatch):
+    output = tmp_path / "gdp.csv"
+    errors = tmp_path / "errors.jsonl"
+    assert cli.main(["fetch", "gdp", "AA", "XX", "-o", str(output), "--errors", str(errors), "-q"]) == 1
+
+    df = pd.read_csv(output)
+    assert df["actor_id"].unique().tolist() == ["AA"]
+    assert [json.loads(line)["actor_id"] for line in errors.read_text().splitlines()] == ["XX"]
+
+    monkeypatch.setattr("sys.stdin", io.StringIO("AA\n# comment\n\nBB\n"))
+    output = tmp_path / "emissions.jsonl"
+    assert cli.main(["fetch", "emissions", "-i", "-", "-f", "jsonl", "-o", str(output), "--chunk-size", "1", "-q"]) == 0
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert {record["actor_id"] for record in records} == {"AA", "BB"}
+
+
+def test_fetch_chunk_columns(offline, overviews, tmp_path):
+    # CC has no initiative and BB no targets, so each chunk has different columns
+    overviews["CC"] = dict(overviews["AA"], actor_id="CC", targets=[dict(overviews["AA"]["targets"][0])])
+    del overviews["CC"]["targets"][0]["initiative"]
+    for fmt in ["csv", "parquet"]:
+        output = tmp_path / f"targets.{fmt}"
+        argv = ["fetch", "targets", "AA", "BB", "CC", "-f", fmt, "-o", str(output), "--chunk-size", "1", "-q"]
+        assert cli.main(argv) == 0
+        df = pd.read_csv(output) if fmt == "csv" else pd.read_parquet(output)
+        assert df.columns.tolist() == list(BatchJob(metric="targets").schema)
+        assert df["actor_id"].tolist() == ["AA", "CC"]
+        assert df["initiative_id"].tolist()[0] == "NDC" and pd.isna(df["initiative_id"].tolist()[1])
+        assert df["baseline_value"].isna().all()
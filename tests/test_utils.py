@@ -0,0 +1,134 @@
+import json
+
+import openclimate
+import pandas as pd
+import pytest
+import requests
+
+from openclimate.Search import Search
+from openclimate.utils import iter_json_array, read_csv, read_jsonl
+
+
+def _chunks(body, size):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+def test_iter_json_array():
+    data = [{"actor_id": f"A{i}", "name": "Québec", "value": i * 1.5, "tags": []} for i in range(100)]
+    body = json.dumps({"meta": {"text": "}],"}, "data": data, "total": 100}).encode()
+    for size in [1, 7, 4096]:
+        assert list(iter_json_array(_chunks(body, size))) == data
+
+    assert list(iter_json_array([b'{"data": []}'])) == []
+    with pytest.raises(KeyError):
+        list(iter_json_array([b'{"message": "not found"}']))
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        (b'{"total": 12.5, "data": [1]}', [1]),
+        (b'{"total": -1.5e+10, "flag": true, "data": [1.5, 2e3, -0.25E-3, 7, false, null, "x"]}',
+         [1.5, 2e3, -0.25e-3, 7, False, None, "x"]),
+    ],
+)
+def test_iter_json_array_split_scalars(body, expected):
+    # numbers split inside their fraction or exponent, as skipped keys and as array items
+    for i in range(1, len(body)):
+        assert list(iter_json_array([body[:i], body[i:]])) == expected
+
+
+def test_read_files(tmp_path):
+    path = tmp_path / "status.jsonl"
+    path.write_text('{"actor_id": "NA"}\n{"actor_id": "US"}\n{"actor_')
+    assert read_jsonl(str(path)) == [{"actor_id": "NA"}, {"actor_id": "US"}]
+
+    path = tmp_path / "part.csv"
+    path.write_text("actor_id,year,value\nNA,2000,\nUS,2000,1.5\n")
+    df = read_csv(str(path))
+    assert df["actor_id"].tolist() == ["NA", "US"]
+    assert df["value"].isna().tolist() == [True, False]
+
+
+class _Raw:
+    def __init__(self, body):
+        self.body = body
+
+    def tell(self):
+        return len(self.body)
+
+
+class _Response:
+    def __init__(self, body):
+        self.body = body
+        self.raw = _Raw(body)
+        self.headers = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def iter_content(self, chunk_size=1):
+        return iter(_chunks(self.body, chunk_size))
+
+
+def test_iter_parts(monkeypatch):
+    data = [{"actor_id": f"A{i}", "name": f"A{i}", "type": "city"} for i in range(25)]
+    monkeypatch.setattr(requests, "get", lambda *args, **kwargs: _Response(json.dumps({"data": data}).encode()))
+    client = openclimate.Client()
+
+    assert list(client.iter_parts(actor_id="EARTH")) == data
+    pages = list(client.iter_parts(actor_id="EARTH", page_size=10))
+    assert [len(df) for df in pages] == [10, 10, 5]
+
+    pages = list(client.iter_search(query="A", page_size=10))
+    assert pages[0].columns.tolist() == Search.columns
+
+
+def test_normalize_datasources(offline):
+    client = openclimate.Client()
+    df = client.gdp(actor_id=["AA", "BB"], ignore_warnings=True)
+    facts, datasources = client.gdp(actor_id=["AA", "BB"], ignore_warnings=True, normalize=True)
+
+    assert facts.columns.tolist() == ["actor_id", "year", "gdp", "datasource_key"]
+    assert facts["datasource_key"].dtype == "int32"
+    assert datasources.columns.tolist() == ["datasource_key", "datasource_id", "datasource_name", "datasource_published", "datasource_URL"]
+    assert len(datasources) == 1
+    joined = facts.merge(datasources, on="datasource_key").drop(columns=["datasource_key"])
+    pd.testing.assert_frame_equal(joined.loc[:, df.columns].reset_index(drop=True), df.reset_index(drop=True), check_dtype=False)
+
+    facts, datasources = client.emissions(actor_id=["AA", "BB"], datasource_id="DS:emissions:b", normalize=True)
+    assert datasources["datasource_id"].tolist() == ["DS:emissions:b"]
+    assert datasources["datasource_name"].tolist() == ["emissions b"]
+    assert (facts["datasource_key"] == 0).all()
+
+    facts, datasources = client.emissions_datasets(actor_id=["AA", "BB"], normalize=True)
+    assert facts.columns.tolist() == ["actor_id", "datasource_key"]
+    assert len(facts) == 4 and len(datasources) == 2
+
+    facts, datasources = client.targets(actor_id=["AA", "AA-1"], normalize=True)
+    assert "datasource_name" not in facts.columns
+    assert datasources.loc[0, ["datasource_id", "datasource_name", "datasource_URL"]].tolist() == [
+        "DS:targets",
+        "targets",
+        "https://example.org/DS:targets",
+    ]
+
+
+@pytest.mark.parametrize("backend", ["arrow", "polars"])
+@pytest.mark.parametrize("metric", ["emissions", "targets", "gdp", "population"])
+def test_backend(offline, backend, metric):
+    pytest.importorskip({"arrow": "pyarrow", "polars": "polars"}[backend])
+    client = openclimate.Client()
+    expected = getattr(client, metric)(actor_id=["AA", "BB"], ignore_warnings=True).reset_index(drop=True)
+    result = getattr(client, metric)(actor_id=["AA", "BB"], ignore_warnings=True, backend=backend)
+
+    assert (result.num_rows if backend == "arrow" else result.height) == len(expected)
+    pd.testing.assert_frame_equal(result.to_pandas(), expected, check_dtype=False)
+
+
+def test_backend_unknown(offline):
+    with pytest.raises(ValueError):
+        openclimate.Client().gdp(actor_id="AA", backend="not_a_backend")